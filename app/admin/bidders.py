@@ -2,21 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
 
-from fastapi import APIRouter, Depends, Request
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
 
 from ..bidders.registry import BidderRegistry
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-def _get_registry(request: Request) -> BidderRegistry:
+async def _get_registry(request: Request) -> BidderRegistry:
     return request.app.state.bidder_registry
 
 
-@router.get("/bidders")
-async def bidders(registry: BidderRegistry = Depends(_get_registry)) -> list[dict[str, Any]]:
+@lru_cache(maxsize=4)
+def _render_inventory(registry: BidderRegistry, version: int) -> bytes:
     inventory = []
     for bidder in registry.all():
         inventory.append(
@@ -28,4 +29,10 @@ async def bidders(registry: BidderRegistry = Depends(_get_registry)) -> list[dic
                 "status": "active",
             }
         )
-    return inventory
+    return orjson.dumps(inventory)
+
+
+@router.get("/bidders")
+async def bidders(registry: BidderRegistry = Depends(_get_registry)) -> Response:
+    # The inventory only changes on registry reload, so serve pre-serialized bytes.
+    return Response(_render_inventory(registry, registry.version), media_type="application/json")
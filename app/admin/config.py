@@ -2,41 +2,45 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Request
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, Request, Response
 
 from ..bidders.registry import BidderRegistry
-from ..config import ServerConfig
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-def _get_config(request: Request) -> ServerConfig:
-    return request.app.state.server_config
+async def _get_bidder_registry(request: Request) -> BidderRegistry:
+    return request.app.state.bidder_registry
 
 
-def _get_bidder_registry(request: Request) -> BidderRegistry:
-    return request.app.state.bidder_registry
+@lru_cache(maxsize=4)
+def _render_config(app: FastAPI, registry: BidderRegistry, version: int) -> bytes:
+    config = app.state.server_config
+    pool_definitions = [
+        {"name": name, "bidders": list(names), "active": bool(names)}
+        for name, names in registry.pools_index.items()
+    ]
+    return orjson.dumps(
+        {
+            "auction_window_ms": config.auction.window_ms,
+            "pool_definitions": pool_definitions,
+            "pubsub_provider": config.auction.distribution_backend,
+            "version": app.version,
+            "storage_backend": config.ledger.backend,
+        }
+    )
 
 
 @router.get("/config")
 async def config(
     request: Request,
-    config: ServerConfig = Depends(_get_config),
     registry: BidderRegistry = Depends(_get_bidder_registry),
-) -> dict:
-    pools: dict[str, list[str]] = {}
-    for bidder in registry.all():
-        for pool in bidder.pools:
-            pools.setdefault(pool, []).append(bidder.name)
-    pool_definitions = [
-        {"name": name, "bidders": sorted(names), "active": bool(names)}
-        for name, names in sorted(pools.items())
-    ]
-    distribution = config.auction.distribution
-    return {
-        "auction_window_ms": config.auction.window_ms,
-        "pool_definitions": pool_definitions,
-        "pubsub_provider": distribution.get("backend", "local"),
-        "version": request.app.version,
-        "storage_backend": config.ledger.backend,
-    }
+) -> Response:
+    # Server config is fixed for the app's lifetime; only registry reloads change the payload.
+    return Response(
+        _render_config(request.app, registry, registry.version),
+        media_type="application/json",
+    )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
 
 from fastapi import APIRouter, Request
 
@@ -11,9 +11,9 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 
 @router.get("/health")
 async def health(request: Request) -> dict[str, int | str]:
-    start_time = getattr(request.app.state, "start_time", None)
-    if start_time:
-        uptime = int((datetime.now(timezone.utc) - start_time).total_seconds())
+    monotonic_start = getattr(request.app.state, "monotonic_start", None)
+    if monotonic_start is not None:
+        uptime = int(time.monotonic() - monotonic_start)
     else:
         uptime = 0
     settings = request.app.state.server_config
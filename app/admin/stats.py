@@ -13,11 +13,11 @@ from ..ledger.apply import LedgerService
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-def _get_ledger(request: Request) -> LedgerService:
+async def _get_ledger(request: Request) -> LedgerService:
     return request.app.state.ledger
 
 
-def _get_bidder_registry(request: Request) -> BidderRegistry:
+async def _get_bidder_registry(request: Request) -> BidderRegistry:
     return request.app.state.bidder_registry
 
 
@@ -26,31 +26,38 @@ async def stats(
     ledger: LedgerService = Depends(_get_ledger),
     registry: BidderRegistry = Depends(_get_bidder_registry),
 ) -> dict[str, Any]:
-    records = await ledger.list_records()
-    total_auctions = len(records)
-    total_bids = sum(len(record.get("bids", [])) for record in records)
-    no_bid_count = sum(1 for record in records if record.get("no_bid"))
-    no_bid_rate = (no_bid_count / total_auctions) if total_auctions else 0.0
-
+    total_auctions = 0
+    no_bid_count = 0
+    total_bids = 0
+    pool_distribution: Counter[str] = Counter()
+    invited_by_bidder: Counter[str] = Counter()
     bids_by_bidder: Counter[str] = Counter()
     wins_by_bidder: Counter[str] = Counter()
-    invited_by_bidder: Counter[str] = Counter()
-    pool_distribution: Counter[str] = Counter()
-
-    for record in records:
-        for pool in record.get("pools", []):
-            pool_distribution[pool] += 1
-        for bidder in record.get("eligible_bidders", []):
-            invited_by_bidder[bidder] += 1
-        for bid in record.get("bids", []):
-            bidder_name = _bidder_from_payload(bid)
-            if bidder_name:
-                bids_by_bidder[bidder_name] += 1
-        winner_payload = record.get("winner")
-        if winner_payload:
-            bidder_name = _bidder_from_payload(winner_payload)
-            if bidder_name:
-                wins_by_bidder[bidder_name] += 1
+    # Aggregate page by page so memory stays bounded as the ledger grows.
+    async for records in ledger.iter_record_pages():
+        total_auctions += len(records)
+        no_bid_count += sum(1 for record in records if record.get("no_bid"))
+
+        # Flatten the ragged per-record lists once so the counting itself runs in
+        # Counter's C-level element counter instead of a per-item Python loop.
+        pools: list[str] = []
+        invited: list[str] = []
+        bids: list[dict[str, Any]] = []
+        winners: list[dict[str, Any]] = []
+        for record in records:
+            pools.extend(record.get("pools", ()))
+            invited.extend(record.get("eligible_bidders", ()))
+            bids.extend(record.get("bids", ()))
+            winner_payload = record.get("winner")
+            if winner_payload:
+                winners.append(winner_payload)
+        total_bids += len(bids)
+
+        pool_distribution.update(pools)
+        invited_by_bidder.update(invited)
+        bids_by_bidder.update(filter(None, map(_bidder_from_payload, bids)))
+        wins_by_bidder.update(filter(None, map(_bidder_from_payload, winners)))
+    no_bid_rate = (no_bid_count / total_auctions) if total_auctions else 0.0
 
     bidder_success_rates = {
         bidder: round(wins_by_bidder[bidder] / bids_by_bidder[bidder], 4)
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Iterable
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Sequence
 
-from ..transport.canonical_json import canonical_dumps
+from ..transport.canonical_json import canonical_dumps, canonical_fragment
 
 try:  # pragma: no cover - optional dependency
     from google.cloud import pubsub_v1
@@ -17,13 +19,18 @@ logger = logging.getLogger(__name__)
 
 
 class _PublisherProtocol:
-    async def publish(self, auction_id: str, pool: str, payload: dict[str, Any]) -> None:  # pragma: no cover - protocol
+    def prepare(self, payload: dict[str, Any]) -> Any:
+        return payload
+
+    def submit(self, auction_id: str, pool: str, payload: Any) -> Future | None:  # pragma: no cover - protocol
+        """Hand a message to the transport, returning a delivery future if any."""
         raise NotImplementedError
 
 
 class _LocalPublisher(_PublisherProtocol):
-    async def publish(self, auction_id: str, pool: str, payload: dict[str, Any]) -> None:
+    def submit(self, auction_id: str, pool: str, payload: Any) -> Future | None:
         logger.info("[local-pubsub] auction=%s pool=%s delivered", auction_id, pool)
+        return None
 
 
 class _PubSubPublisher(_PublisherProtocol):
@@ -34,19 +41,46 @@ class _PubSubPublisher(_PublisherProtocol):
         if not self._project_id:
             raise ValueError("pubsub backend requires project_id")
         self._topic_prefix = options.get("topic_prefix", "aip-context")
-        self._publisher = pubsub_v1.PublisherClient()
+        self._topic_by_pool: dict[str, str] = {}
+        self._publisher = _shared_publisher_client(
+            int(options.get("batch_max_messages", 100)),
+            int(options.get("batch_max_bytes", 1 << 20)),
+            float(options.get("batch_max_latency", 0.005)),
+        )
 
     def _topic_path(self, pool: str) -> str:
+        topic = self._topic_by_pool.get(pool)
+        if topic is None:
+            topic = self._topic_by_pool[pool] = self._build_topic_path(pool)
+        return topic
+
+    def _build_topic_path(self, pool: str) -> str:
         topic = f"{self._topic_prefix}-{pool}" if not self._topic_prefix.endswith(pool) else self._topic_prefix
         if topic.startswith("projects/"):
             return topic
         return self._publisher.topic_path(self._project_id, topic)
 
-    async def publish(self, auction_id: str, pool: str, payload: dict[str, Any]) -> None:
+    def prepare(self, payload: dict[str, Any]) -> Any:
+        # Encode the shared context once per fanout rather than once per pool.
+        return canonical_fragment(payload)
+
+    def submit(self, auction_id: str, pool: str, payload: Any) -> Future | None:
         message = canonical_dumps({"auction_id": auction_id, "pool": pool, "context": payload})
         topic = self._topic_path(pool)
-        future = self._publisher.publish(topic, message, pool=pool, auction_id=auction_id)
-        await asyncio.to_thread(future.result)
+        return self._publisher.publish(topic, message, pool=pool, auction_id=auction_id)
+
+
+@lru_cache(maxsize=None)
+def _shared_publisher_client(max_messages: int, max_bytes: int, max_latency: float) -> Any:
+    """Return one PublisherClient per batch configuration so the gRPC channel is shared."""
+    # Client-side batching coalesces every pool of one fanout into as few
+    # publish RPCs as possible.
+    batch_settings = pubsub_v1.types.BatchSettings(
+        max_messages=max_messages,
+        max_bytes=max_bytes,
+        max_latency=max_latency,
+    )
+    return pubsub_v1.PublisherClient(batch_settings=batch_settings)
 
 
 class BidFanout:
@@ -60,9 +94,17 @@ class BidFanout:
     async def publish(
         self,
         auction_id: str,
-        pools: Iterable[str],
+        pools: Sequence[str],
         payload: dict[str, Any],
     ) -> None:
-        tasks = [self._publisher.publish(auction_id, pool, payload) for pool in set(pools)]
-        if tasks:
-            await asyncio.gather(*tasks)
+        """Publish ``payload`` to every pool; ``pools`` must already be de-duplicated."""
+        prepared = self._publisher.prepare(payload)
+        futures: list[Future] = []
+        for pool in pools:
+            future = self._publisher.submit(auction_id, pool, prepared)
+            if future is not None:
+                futures.append(future)
+        if futures:
+            # Submit everything first so the client can batch, then await the
+            # delivery futures on the loop without parking a worker thread.
+            await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
@@ -11,3 +11,5 @@ class BidResponse:
     bidder: str
     payload: dict[str, Any]
     price: float
+    # (canonical bytes, signature, public key) still awaiting verification.
+    signed: tuple[bytes, str, str] | None = None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from ..bidders.registry import BidderRegistry
@@ -28,19 +29,18 @@ class AuctionRunner:
         self._window_ms = window_ms
 
     async def run(self, context_request: dict[str, Any]) -> dict[str, Any]:
-        record = await self._ledger.create_record(context_request)
-        serve_token = record["serve_token"]
-        auction_id = record["auction_id"]
         pools = self._classify_pools(context_request)
         eligible_bidders = self._registry.filter_by_pools(pools)
         eligible_names = [bidder.name for bidder in eligible_bidders]
-        await self._ledger.annotate_record(
-            serve_token,
-            {
-                "pools": pools,
-                "eligible_bidders": eligible_names,
-            },
+        # Persist routing annotations with the initial write rather than a
+        # follow-up update, saving a storage round-trip per auction.
+        record = await self._ledger.create_record(
+            context_request,
+            pools=pools,
+            eligible_bidders=eligible_names,
         )
+        serve_token = record["serve_token"]
+        auction_id = record["auction_id"]
         await self._inbox.register(serve_token, eligible_names)
         publish_payload = {
             "auction_id": auction_id,
@@ -49,8 +49,12 @@ class AuctionRunner:
             "context_request": context_request,
             "bidders": eligible_names,
         }
-        await self._fanout.publish(auction_id, pools, publish_payload)
-        bids = await self._inbox.collect(serve_token, self._window_ms)
+        # Open the collection window while the publish RPC is in flight so
+        # its latency overlaps with bidders' response time.
+        _, bids = await asyncio.gather(
+            self._fanout.publish(auction_id, pools, publish_payload),
+            self._inbox.collect(serve_token, self._window_ms),
+        )
         if not bids:
             return await self._ledger.record_no_bid(serve_token)
         winner = select_winner(bids)
@@ -58,33 +62,30 @@ class AuctionRunner:
         return result
 
     def _classify_pools(self, context_request: dict[str, Any]) -> list[str]:
-        candidates: list[Any] = [
-            context_request.get("category_pools"),
-            context_request.get("categories"),
-            context_request.get("pools"),
-            context_request.get("verticals"),
-        ]
-        context = context_request.get("context")
-        if isinstance(context, dict):
-            candidates.extend(
-                [
-                    context.get("category_pools"),
-                    context.get("categories"),
-                    context.get("pools"),
-                ]
-            )
-        features = context_request.get("features")
-        if isinstance(features, dict):
-            candidates.append(features.get("topic"))
-        pools: Any = next((value for value in candidates if value), None)
+        """Return the auction's category pools, unique and in first-seen order."""
+        pools = _first_present(context_request, _TOP_LEVEL_POOL_KEYS)
+        if not pools:
+            context = context_request.get("context")
+            if isinstance(context, dict):
+                pools = _first_present(context, _POOL_KEYS)
+        if not pools:
+            features = context_request.get("features")
+            if isinstance(features, dict):
+                pools = features.get("topic")
         if not pools:
             return ["default"]
         if isinstance(pools, str):
             return [pools]
-        ordered = []
-        seen: set[str] = set()
-        for pool in pools:
-            if pool not in seen:
-                ordered.append(pool)
-                seen.add(pool)
-        return ordered or ["default"]
+        return list(dict.fromkeys(pools)) or ["default"]
+
+
+_POOL_KEYS = ("category_pools", "categories", "pools")
+_TOP_LEVEL_POOL_KEYS = _POOL_KEYS + ("verticals",)
+
+
+def _first_present(source: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        value = source.get(key)
+        if value:
+            return value
+    return None
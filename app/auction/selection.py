@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Iterable, Optional
 
 from .models import BidResponse
 
+_PRICE = attrgetter("price")
+
 
 def select_winner(bids: Iterable[BidResponse]) -> Optional[BidResponse]:
-    return max(bids, key=lambda bid: bid.price, default=None)
+    return max(bids, key=_PRICE, default=None)
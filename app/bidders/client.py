@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 import httpx
+import orjson
 
 from ..transport.signatures import SignatureError, verify_signature
 from ..transport.timestamps import TimestampError, assert_within_skew
@@ -15,11 +15,26 @@ from ..auction.models import BidResponse
 
 
 class BidderClient:
-    def __init__(self, *, max_skew_ms: int, nonce_cache: NonceCache) -> None:
-        self._client = httpx.AsyncClient()
+    def __init__(
+        self,
+        *,
+        max_skew_ms: int,
+        nonce_cache: NonceCache,
+        max_connections: int = 1024,
+        max_keepalive_connections: int = 256,
+    ) -> None:
+        # HTTP/2 multiplexes concurrent bid requests over one connection per
+        # bidder host instead of opening new TLS connections under load.
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=30.0,
+            ),
+        )
         self._max_skew_ms = max_skew_ms
         self._nonce_cache = nonce_cache
-        self._lock = asyncio.Lock()
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -32,7 +47,7 @@ class BidderClient:
                 timeout=bidder.timeout_ms / 1000,
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             await self._enforce_transport_guards(data, bidder.public_key)
             price = float(data.get("price", 0))
             return BidResponse(bidder=bidder.name, payload=data, price=price)
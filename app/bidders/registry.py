@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
-import yaml
+from ..config import load_yaml
 
 
 @dataclass(frozen=True)
@@ -16,20 +16,26 @@ class BidderConfig:
     public_key: str
     timeout_ms: int = 200
     pools: tuple[str, ...] = ("default",)
+    _pool_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_pool_set", frozenset(self.pools))
 
     def is_subscribed(self, pools: Iterable[str]) -> bool:
-        pool_set = set(pools)
-        return any(pool in pool_set for pool in self.pools)
+        return not self._pool_set.isdisjoint(pools)
 
 
 class BidderRegistry:
     def __init__(self, config_path: Path) -> None:
         self._path = config_path
         self._bidders: dict[str, BidderConfig] = {}
+        self._pools_index: dict[str, tuple[str, ...]] = {}
+        self._order: dict[str, int] = {}
+        self._version = 0
         self.reload()
 
     def reload(self) -> None:
-        data = yaml.safe_load(self._path.read_text()) or {}
+        data = load_yaml(self._path)
         bidders = {}
         for item in data.get("bidders", []):
             cfg = BidderConfig(
@@ -40,7 +46,26 @@ class BidderRegistry:
                 pools=tuple(item.get("pools", ["default"])),
             )
             bidders[cfg.name] = cfg
+        pools: dict[str, list[str]] = {}
+        for cfg in bidders.values():
+            for pool in cfg.pools:
+                pools.setdefault(pool, []).append(cfg.name)
         self._bidders = bidders
+        self._order = {name: index for index, name in enumerate(bidders)}
+        self._pools_index = {
+            pool: tuple(sorted(set(names))) for pool, names in sorted(pools.items())
+        }
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Monotonic token bumped on every reload, used to invalidate derived caches."""
+        return self._version
+
+    @property
+    def pools_index(self) -> dict[str, tuple[str, ...]]:
+        """Pool name -> sorted subscriber names, ordered by pool name."""
+        return self._pools_index
 
     def all(self) -> Iterable[BidderConfig]:
         return self._bidders.values()
@@ -49,4 +74,6 @@ class BidderRegistry:
         return self._bidders.get(name)
 
     def filter_by_pools(self, pools: Iterable[str]) -> list[BidderConfig]:
-        return [bidder for bidder in self._bidders.values() if bidder.is_subscribed(pools)]
+        """Subscribers of any of ``pools``, in registration (YAML) order."""
+        names = {name for pool in pools for name in self._pools_index.get(pool, ())}
+        return [self._bidders[name] for name in sorted(names, key=self._order.__getitem__)]
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
 import yaml
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - fallback when libyaml missing
+    from yaml import SafeLoader as _YamlLoader
+
 _DEFAULT_SERVER_CONFIG = Path(__file__).resolve().parent / "server.yaml"
 _DEFAULT_BIDDER_CONFIG = Path(__file__).resolve().parent / "bidders.yaml"
 
@@ -30,6 +35,9 @@ class LedgerConfig:
 class AuctionConfig:
     window_ms: int
     distribution: Mapping[str, Any]
+    distribution_backend: str = "local"
+    # Upper bound on concurrently running background (weave) auctions.
+    max_background_auctions: int = 64
 
 
 @dataclass(frozen=True)
@@ -38,6 +46,12 @@ class OperatorConfig:
     allowed_formats: tuple[str, ...]
 
 
+@dataclass(frozen=True)
+class ValidationConfig:
+    # Checking our own auction_result responses is a development aid.
+    validate_responses: bool = True
+
+
 @dataclass(frozen=True)
 class ServerConfig:
     listen: Mapping[str, Any]
@@ -45,18 +59,29 @@ class ServerConfig:
     ledger: LedgerConfig
     auction: AuctionConfig
     operator: OperatorConfig
+    validation: ValidationConfig = field(default_factory=ValidationConfig)
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
+def load_yaml(path: Path) -> dict[str, Any]:
+    """Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    The returned mapping is shared between callers and must not be mutated.
+    """
     if not path.exists():
         raise FileNotFoundError(path)
-    return yaml.safe_load(path.read_text()) or {}
+    stat = path.stat()
+    return _parse_yaml(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    return yaml.load(Path(path).read_text(), Loader=_YamlLoader) or {}
 
 
 @lru_cache(maxsize=1)
 def get_server_config() -> ServerConfig:
     path = Path(os.getenv("AIP_CONFIG_PATH", _DEFAULT_SERVER_CONFIG))
-    data = _load_yaml(path)
+    data = load_yaml(path)
     transport = data.get("transport", {})
     ledger = data.get("ledger", {})
     options = dict(ledger.get("options") or {})
@@ -64,6 +89,7 @@ def get_server_config() -> ServerConfig:
     distribution = dict(auction.get("distribution") or {})
     operator = data.get("operator", {})
     allowed_formats = tuple(operator.get("allowed_formats") or ("weave",))
+    validation = data.get("validation", {})
     return ServerConfig(
         listen=data.get("listen", {}),
         transport=TransportConfig(
@@ -77,11 +103,16 @@ def get_server_config() -> ServerConfig:
         auction=AuctionConfig(
             window_ms=int(auction.get("window_ms", data.get("auction_window_ms", 50))),
             distribution=distribution,
+            distribution_backend=str(distribution.get("backend", "local")),
+            max_background_auctions=int(auction.get("max_background_auctions", 64)),
         ),
         operator=OperatorConfig(
             operator_id=str(operator.get("id", "operator")),
             allowed_formats=allowed_formats,
         ),
+        validation=ValidationConfig(
+            validate_responses=bool(validation.get("validate_responses", True)),
+        ),
     )
 
 
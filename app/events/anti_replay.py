@@ -1,19 +1,43 @@
-"""Simple event replay guard based on event_id uniqueness."""
+"""Event replay guard based on event_id uniqueness within a TTL window."""
 
 from __future__ import annotations
 
-import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+def replay_fingerprint(*parts: str) -> bytes:
+    """128-bit digest of a replay key's components, usable directly as a guard key."""
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).digest()
 
 
 class EventReplayGuard:
-    def __init__(self) -> None:
-        self._seen: set[str] = set()
-        self._lock = asyncio.Lock()
+    def __init__(self, ttl_seconds: int = 60, capacity: int = 1_000_000) -> None:
+        self._ttl = ttl_seconds
+        self._capacity = capacity
+        # Insertion-ordered, so the oldest entry is always the next to expire.
+        self._seen: OrderedDict[str | bytes, float] = OrderedDict()
 
-    async def assert_unique(self, event_id: str) -> None:
+    async def assert_unique(self, event_id: str | bytes) -> None:
         if not event_id:
             raise ValueError("event_id missing")
-        async with self._lock:
-            if event_id in self._seen:
-                raise ValueError("event already ingested")
-            self._seen.add(event_id)
+        # No awaits below: check-and-insert is atomic on the event loop.
+        now = time.monotonic()
+        self._evict_expired(now)
+        if event_id in self._seen:
+            raise ValueError("event already ingested")
+        # Evicting a live key would let its replay through, so a full guard
+        # refuses new keys until entries expire.
+        if len(self._seen) >= self._capacity:
+            logger.warning("Replay guard full (%d live keys); rejecting event", self._capacity)
+            raise ValueError("replay guard is full")
+        self._seen[event_id] = now + self._ttl
+
+    def _evict_expired(self, now: float) -> None:
+        seen = self._seen
+        while seen and seen[next(iter(seen))] <= now:
+            seen.popitem(last=False)
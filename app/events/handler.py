@@ -3,24 +3,24 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+import logging
 from dataclasses import dataclass
 from typing import Any, Iterable
 
 from ..auction.models import BidResponse
 from ..bidders.registry import BidderRegistry
 from ..ledger.apply import LedgerService
+from ..ledger.billing import event_priority, max_event_priority
+from ..transport.canonical_json import canonical_dumps
 from ..transport.nonces import NonceCache
-from ..transport.signatures import SignatureError, verify_signature
+from ..transport.signatures import SignatureError, verify_batch, verify_signature
 from ..transport.timestamps import assert_within_skew
-from .anti_replay import EventReplayGuard
+from .anti_replay import EventReplayGuard, replay_fingerprint
 from .validators import validate_event
 
-EVENT_PRIORITY = {
-    "cpx_exposure": 0,
-    "cpc_click": 1,
-    "cpa_conversion": 2,
-}
+logger = logging.getLogger(__name__)
+
+_SIGNATURE_KEYS = frozenset({"signature", "public_key"})
 
 
 class EventService:
@@ -39,17 +39,19 @@ class EventService:
         event_type = payload.get("event_type")
         if not event_type:
             raise ValueError("event_type is required")
-        validate_event(event_type, payload)
         serve_token = payload.get("serve_token")
         if not serve_token:
             raise ValueError("serve_token is required")
         timestamp = payload.get("ts")
         if not timestamp:
             raise ValueError("ts is required")
+        # Cheapest checks first; the signature is verified last so stale and
+        # replayed events never reach the crypto.
         assert_within_skew(timestamp, max_skew_ms=self._max_skew_ms)
+        validate_event(event_type, payload)
         await self._guard.assert_unique(self._replay_key(payload))
         try:
-            record = await self._ledger.get_record(serve_token)
+            record = await self._ledger.get_record(serve_token, fresh=True)
         except KeyError as exc:
             raise ValueError("unknown serve_token") from exc
         if record.get("no_bid"):
@@ -67,22 +69,17 @@ class EventService:
         return await self._ledger.record_event(serve_token, payload)
 
     def _assert_single_charge(self, record: dict[str, Any], event_type: str) -> None:
-        existing_events = record.get("events", [])
-        highest = -1
-        for event in existing_events:
-            priority = EVENT_PRIORITY.get(event.get("event_type", ""), -1)
-            highest = max(highest, priority)
-        current_priority = EVENT_PRIORITY.get(event_type, -1)
-        if current_priority <= highest:
+        if event_priority(event_type) <= max_event_priority(record):
             raise ValueError("event violates single-charge rule")
 
-    def _extract_signed_payload(self, payload: dict[str, Any]) -> dict[str, Any]:
+    def _extract_signed_payload(self, payload: dict[str, Any]) -> bytes:
+        """Canonical bytes the event signature covers, serialized exactly once."""
         envelope = payload.get("payload")
-        if envelope is not None:
-            return envelope
-        return {k: v for k, v in payload.items() if k not in {"signature", "public_key"}}
+        if envelope is None:
+            envelope = {k: v for k, v in payload.items() if k not in _SIGNATURE_KEYS}
+        return canonical_dumps(envelope)
 
-    def _replay_key(self, payload: dict[str, Any]) -> str:
+    def _replay_key(self, payload: dict[str, Any]) -> bytes:
         serve_token = payload.get("serve_token", "")
         event_type = payload.get("event_type", "")
         unique_component = (
@@ -91,34 +88,84 @@ class EventService:
             or payload.get("ts")
             or ""
         )
-        return f"{serve_token}:{event_type}:{unique_component}"
+        return replay_fingerprint(serve_token, event_type, str(unique_component))
 
 
 class BidResponseInbox:
     def __init__(self) -> None:
-        self._responses: dict[str, list[BidResponse]] = defaultdict(list)
+        self._queues: dict[str, asyncio.Queue[BidResponse]] = {}
         self._allowed: dict[str, set[str]] = {}
-        self._lock = asyncio.Lock()
 
     async def register(self, auction_id: str, bidders: Iterable[str]) -> None:
-        async with self._lock:
-            self._allowed[auction_id] = set(bidders)
+        # Completes without suspending, so the auction is open before the
+        # caller's next await (e.g. the fanout publish) can deliver a bid.
+        self._allowed[auction_id] = set(bidders)
+        self._queues[auction_id] = asyncio.Queue()
 
     async def add(self, auction_id: str, response: BidResponse) -> None:
-        async with self._lock:
-            allowed = self._allowed.get(auction_id)
-            if allowed is None:
-                raise PermissionError("serve_token is not active")
-            if response.bidder not in allowed:
-                raise PermissionError("bidder is not subscribed to this auction")
-            self._responses[auction_id].append(response)
+        # No await between the checks and the enqueue, so this is atomic on the loop.
+        allowed = self._allowed.get(auction_id)
+        if allowed is None:
+            raise PermissionError("serve_token is not active")
+        if response.bidder not in allowed:
+            raise PermissionError("bidder is not subscribed to this auction")
+        self._queues[auction_id].put_nowait(response)
 
     async def collect(self, auction_id: str, window_ms: int) -> list[BidResponse]:
-        await asyncio.sleep(window_ms / 1000)
-        async with self._lock:
-            responses = self._responses.pop(auction_id, [])
-            self._allowed.pop(auction_id, None)
-            return responses
+        queue = self._queues.get(auction_id)
+        if queue is None:
+            await asyncio.sleep(window_ms / 1000)
+            return []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + window_ms / 1000
+        # Stop as soon as every eligible bidder has answered instead of idling
+        # out the rest of the window.
+        pending = set(self._allowed.get(auction_id, ()))
+        verified: list[BidResponse] = []
+        while True:
+            arrived = await _receive(queue, pending, deadline)
+            while not queue.empty():
+                arrived.append(queue.get_nowait())
+            if arrived:
+                verified.extend(await asyncio.to_thread(_verified_responses, auction_id, arrived))
+            # A forged bid must not close the window for the real bidder.
+            rejected = {r.bidder for r in arrived} - {r.bidder for r in verified}
+            if not rejected or loop.time() >= deadline:
+                break
+            pending = rejected
+        # Closing needs no lock: nothing suspends between the two pops.
+        self._queues.pop(auction_id, None)
+        self._allowed.pop(auction_id, None)
+        return verified
+
+
+async def _receive(
+    queue: asyncio.Queue[BidResponse], pending: set[str], deadline: float
+) -> list[BidResponse]:
+    loop = asyncio.get_running_loop()
+    arrived: list[BidResponse] = []
+    while pending and (remaining := deadline - loop.time()) > 0:
+        try:
+            response = await asyncio.wait_for(queue.get(), remaining)
+        except asyncio.TimeoutError:
+            break
+        arrived.append(response)
+        pending.discard(response.bidder)
+    return arrived
+
+
+def _verified_responses(serve_token: str, responses: list[BidResponse]) -> list[BidResponse]:
+    """Verify deferred signatures in one pass, dropping responses that fail."""
+    signed = [response for response in responses if response.signed is not None]
+    results = verify_batch(response.signed for response in signed)
+    rejected: set[int] = set()
+    for response, valid in zip(signed, results):
+        if not valid:
+            logger.warning(
+                "Dropping bid from %s for %s: invalid signature", response.bidder, serve_token
+            )
+            rejected.add(id(response))
+    return [response for response in responses if id(response) not in rejected]
 
 
 @dataclass
@@ -156,10 +203,8 @@ class BidResponseService:
         signature = payload.get("signature") or auth.get("signature") or ""
         await self.nonce_cache.assert_fresh(f"{serve_token}:{nonce}:{bidder_name}")
         assert_within_skew(timestamp, max_skew_ms=self.max_skew_ms)
-        try:
-            verify_signature(bid_payload, signature, bidder.public_key)
-        except SignatureError as exc:  # pragma: no cover - delegated to crypto lib
-            raise ValueError(str(exc)) from exc
+        if not signature:
+            raise ValueError("signature missing")
         price_value = self._derive_price(bid_payload)
         response_payload = {
             "serve_token": serve_token,
@@ -167,7 +212,14 @@ class BidResponseService:
             "timestamp": timestamp,
             "signature": signature,
         }
-        response = BidResponse(bidder=bidder.name, payload=response_payload, price=price_value)
+        # Signature checks are deferred to the inbox, which verifies every bid
+        # of the auction in one batch off the event loop.
+        response = BidResponse(
+            bidder=bidder.name,
+            payload=response_payload,
+            price=price_value,
+            signed=(canonical_dumps(bid_payload), signature, bidder.public_key),
+        )
         try:
             await self.inbox.add(serve_token, response)
         except PermissionError as exc:  # pragma: no cover - simple guard
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any, Callable
+
 from ..validation.validator import get_schema_registry
 
 
@@ -16,10 +19,19 @@ EVENT_SCHEMA_MAP = {
 }
 
 
+@lru_cache(maxsize=1)
+def _event_validators() -> dict[str, tuple[str, Callable[[Any], None]]]:
+    registry = get_schema_registry()
+    return {
+        event_type: (schema, registry.validator_for(schema))
+        for event_type, schema in EVENT_SCHEMA_MAP.items()
+    }
+
+
 def validate_event(event_type: str, payload: dict) -> str:
-    schema = EVENT_SCHEMA_MAP.get(event_type)
-    if not schema:
+    entry = _event_validators().get(event_type)
+    if entry is None:
         raise ValueError(f"unknown event type {event_type}")
-    registry = get_schema_registry()
-    registry.validate(schema, payload)
+    schema, validator = entry
+    validator(payload)
     return schema
@@ -2,27 +2,34 @@
 
 from __future__ import annotations
 
+import secrets
 import uuid
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, AsyncIterator
 
 from ..auction.models import BidResponse
 from ..storage import LedgerStorage
-from .billing import clearing_price
-from .fsm import LedgerEvent, LedgerState, transition
+from .billing import clearing_price, event_priority, max_event_priority
+from .fsm import LedgerEvent, LedgerState, state_from, transition
 
 
 @dataclass
 class LedgerService:
     storage: LedgerStorage
 
-    async def create_record(self, context_request: dict[str, Any]) -> dict[str, Any]:
+    async def create_record(
+        self,
+        context_request: dict[str, Any],
+        *,
+        pools: list[str] | None = None,
+        eligible_bidders: list[str] | None = None,
+    ) -> dict[str, Any]:
         auction_id = context_request.get("context_id") or str(uuid.uuid4())
         token_hint = context_request.get("serve_token_hint")
         serve_token = (
-            f"{token_hint}-{uuid.uuid4().hex[:8]}"
+            f"{token_hint}-{secrets.token_hex(4)}"
             if token_hint
-            else f"stk_{uuid.uuid4().hex}"
+            else f"stk_{secrets.token_hex(16)}"
         )
         record = {
             "record_id": serve_token,
@@ -33,9 +40,10 @@ class LedgerService:
             "bids": [],
             "winner": None,
             "events": [],
+            "max_event_priority": -1,
             "no_bid": False,
-            "pools": [],
-            "eligible_bidders": [],
+            "pools": list(pools or []),
+            "eligible_bidders": list(eligible_bidders or []),
         }
         return await self.storage.create_record(record)
 
@@ -45,8 +53,8 @@ class LedgerService:
         bids: list[BidResponse],
         winner: BidResponse | None,
     ) -> dict[str, Any]:
-        record = await self.storage.get_record(record_id)
-        new_state = transition(LedgerState(record["state"]), LedgerEvent.AUCTION_SETTLED)
+        record = await self.storage.get_record(record_id, fresh=True)
+        new_state = transition(state_from(record["state"]), LedgerEvent.AUCTION_SETTLED)
         payload = {
             "state": new_state.value,
             "bids": [bid.payload for bid in bids],
@@ -56,16 +64,20 @@ class LedgerService:
         return await self.storage.update_record(record_id, payload)
 
     async def record_event(self, record_id: str, event_payload: dict[str, Any]) -> dict[str, Any]:
-        record = await self.storage.get_record(record_id)
-        payload: dict[str, Any] = {}
+        record = await self.storage.get_record(record_id, fresh=True)
+        # Keep the running max so single-charge checks need not rescan events.
+        payload: dict[str, Any] = {
+            "max_event_priority": max(
+                max_event_priority(record),
+                event_priority(event_payload.get("event_type", "")),
+            ),
+        }
+        current = state_from(record["state"])
         try:
-            new_state = transition(LedgerState(record["state"]), LedgerEvent.EVENT_INGESTED)
-            payload["state"] = new_state.value
+            payload["state"] = transition(current, LedgerEvent.EVENT_INGESTED).value
         except ValueError:
-            new_state = LedgerState(record["state"])
-        if payload:
-            await self.storage.update_record(record_id, payload)
-        return await self.storage.append_event(record_id, event_payload)
+            pass
+        return await self.storage.apply_event(record_id, payload, event_payload)
 
     async def record_no_bid(self, record_id: str) -> dict[str, Any]:
         return await self.storage.update_record(
@@ -82,8 +94,23 @@ class LedgerService:
     async def annotate_record(self, record_id: str, updates: dict[str, Any]) -> dict[str, Any]:
         return await self.storage.update_record(record_id, updates)
 
-    async def get_record(self, record_id: str) -> dict[str, Any]:
-        return await self.storage.get_record(record_id)
+    async def get_record(self, record_id: str, *, fresh: bool = False) -> dict[str, Any]:
+        """Load a record; ``fresh`` skips any in-process read cache.
+
+        Billing decisions (single-charge, running max priority) need ``fresh``:
+        another server may have recorded an event the cache hasn't seen.
+        """
+        return await self.storage.get_record(record_id, fresh=fresh)
 
     async def list_records(self) -> list[dict[str, Any]]:
         return await self.storage.list_records()
+
+    async def iter_record_pages(self, page_size: int = 500) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the ledger one page at a time instead of loading it whole."""
+        cursor: str | None = None
+        while True:
+            records, cursor = await self.storage.list_records_page(cursor=cursor, limit=page_size)
+            if records:
+                yield records
+            if cursor is None:
+                return
@@ -2,15 +2,44 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any, Iterable
 
 from ..auction.models import BidResponse
 
+# Billable event tiers; a record may only be charged for increasing tiers.
+EVENT_PRIORITY = {
+    "cpx_exposure": 0,
+    "cpc_click": 1,
+    "cpa_conversion": 2,
+}
+
+
+def event_priority(event_type: str) -> int:
+    return EVENT_PRIORITY.get(event_type, -1)
+
+
+def max_event_priority(record: dict[str, Any]) -> int:
+    """Highest billed tier on a record, scanning events only for legacy records."""
+    cached = record.get("max_event_priority")
+    if cached is not None:
+        return cached
+    return max(
+        (event_priority(event.get("event_type", "")) for event in record.get("events", [])),
+        default=-1,
+    )
+
 
 def clearing_price(bids: Iterable[BidResponse], winner: BidResponse | None) -> float:
     if not winner:
         return 0.0
-    sorted_bids = sorted(bids, key=lambda bid: bid.price, reverse=True)
-    if len(sorted_bids) < 2:
+    # Second price via one pass over the bids instead of sorting them all.
+    first = second = float("-inf")
+    for bid in bids:
+        price = bid.price
+        if price > first:
+            first, second = price, first
+        elif price > second:
+            second = price
+    if second == float("-inf"):
         return winner.price
-    return sorted_bids[1].price
+    return second
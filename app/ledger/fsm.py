@@ -17,6 +17,17 @@ class LedgerEvent(str, Enum):
     EVENT_INGESTED = "event_ingested"
 
 
+_STATE_BY_VALUE = {state.value: state for state in LedgerState}
+
+
+def state_from(value: str) -> LedgerState:
+    """Look up a stored state string without going through Enum's value call."""
+    try:
+        return _STATE_BY_VALUE[value]
+    except KeyError as exc:
+        raise ValueError(f"{value!r} is not a valid LedgerState") from exc
+
+
 _TRANSITIONS = {
     (LedgerState.CREATED, LedgerEvent.AUCTION_SETTLED): LedgerState.AUCTION_COMPLETED,
     (
@@ -26,8 +37,20 @@ _TRANSITIONS = {
 }
 
 
+# Dense table indexed by member position, so a transition is two list indexes
+# rather than a tuple allocation and a dict lookup.
+for _index, _state in enumerate(LedgerState):
+    _state._index = _index
+for _index, _event in enumerate(LedgerEvent):
+    _event._index = _index
+del _index, _state, _event
+_TRANSITION_TABLE: list[list[LedgerState | None]] = [
+    [_TRANSITIONS.get((state, event)) for event in LedgerEvent] for state in LedgerState
+]
+
+
 def transition(current: LedgerState, event: LedgerEvent) -> LedgerState:
-    try:
-        return _TRANSITIONS[(current, event)]
-    except KeyError as exc:
-        raise ValueError(f"invalid transition from {current} via {event}") from exc
+    next_state = _TRANSITION_TABLE[current._index][event._index]
+    if next_state is None:
+        raise ValueError(f"invalid transition from {current} via {event}")
+    return next_state
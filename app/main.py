@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
+import logging
+import math
 import re
-from typing import Any
-from uuid import uuid4
+import secrets
+import time
+from typing import Any, Callable
 
 from fastapi import Body, Depends, FastAPI, HTTPException, Request, status
 from jsonschema import ValidationError
@@ -22,11 +25,22 @@ from .events.anti_replay import EventReplayGuard
 from .events.handler import BidResponseInbox, BidResponseService, EventService
 from .ledger.apply import LedgerService
 from .storage import LedgerStorage, build_storage
+from .transport.json_route import ORJSONRoute
 from .transport.nonces import NonceCache
 from .validation.validator import SchemaRegistry, get_schema_registry
 from .auction.fanout import BidFanout
 from .weave import WeaveService
 
+logger = logging.getLogger(__name__)
+
+_SLUG_RE = re.compile(r"[^a-z0-9_-]")
+_HUNDRED = Decimal(100)
+_WHOLE_CENTS = Decimal(1)
+# Decision phase by conversation length; four or more messages means "decide".
+_DECISION_PHASES = ("research", "research", "research", "compare", "decide")
+_EVENT_ACCEPTED: dict[str, Any] = {"status": "accepted", "serve_token": None, "event_type": None}
+_DECIMAL_RE = re.compile(r"([+-]?)(\d+|\d*(?=\.\d))(?:\.(\d*))?")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -36,11 +50,17 @@ async def lifespan(app: FastAPI):
     nonce_cache = NonceCache(server_config.transport.nonce_ttl_seconds)
     storage = build_storage(server_config)
     ledger_service = LedgerService(storage)
-    replay_guard = EventReplayGuard()
-    distribution = server_config.auction.distribution
+    # A timestamp passes the skew check for 2 * max_clock_skew_ms, so replay
+    # keys must outlive that window or a late replay would be accepted.
+    replay_guard = EventReplayGuard(
+        max(
+            server_config.transport.nonce_ttl_seconds,
+            math.ceil(2 * server_config.transport.max_clock_skew_ms / 1000),
+        )
+    )
     fanout = BidFanout(
-        backend=distribution.get("backend", "local"),
-        options=distribution,
+        backend=server_config.auction.distribution_backend,
+        options=server_config.auction.distribution,
     )
     bid_inbox = BidResponseInbox()
     auction_runner = AuctionRunner(
@@ -64,6 +84,7 @@ async def lifespan(app: FastAPI):
     weave_service = WeaveService(
         storage=storage,
         auction_runner=auction_runner,
+        max_concurrent_auctions=server_config.auction.max_background_auctions,
     )
 
     app.state.server_config = server_config
@@ -78,10 +99,25 @@ async def lifespan(app: FastAPI):
     app.state.bid_inbox = bid_inbox
     app.state.bid_response_service = bid_response_service
     app.state.weave_service = weave_service
+    app.state.auction_deps = AuctionDeps(
+        auction_runner,
+        schema_registry.validator_for("platform_request"),
+        schema_registry.validator_for("context_request"),
+        schema_registry.validator_for("auction_result"),
+        server_config,
+    )
+    app.state.bid_response_deps = BidResponseDeps(
+        schema_registry.validator_for("bid"), bid_response_service
+    )
     app.state.start_time = datetime.now(timezone.utc)
+    app.state.monotonic_start = time.monotonic()
 
     yield
 
+    close = getattr(storage, "aclose", None)
+    if close is not None:
+        await close()
+
 
 app = FastAPI(
     title="AIP Reference Server",
@@ -89,6 +125,7 @@ app = FastAPI(
     docs_url="/docs",
     lifespan=lifespan,
 )
+app.router.route_class = ORJSONRoute
 
 app.include_router(admin_health.router)
 app.include_router(admin_stats.router)
@@ -97,44 +134,71 @@ app.include_router(admin_bidders.router)
 
 
 # Dependency helpers ---------------------------------------------------------
+# Declared async so FastAPI calls them inline instead of via the threadpool.
 
 
-def get_server_settings(request: Request) -> ServerConfig:
+async def get_server_settings(request: Request) -> ServerConfig:
     return request.app.state.server_config
 
 
-def get_schema_service(request: Request) -> SchemaRegistry:
+async def get_schema_service(request: Request) -> SchemaRegistry:
     return request.app.state.schema_registry
 
 
-def get_auction_runner(request: Request) -> AuctionRunner:
+async def get_auction_runner(request: Request) -> AuctionRunner:
     return request.app.state.auction_runner
 
 
-def get_event_service(request: Request) -> EventService:
+async def get_event_service(request: Request) -> EventService:
     return request.app.state.event_service
 
 
-def get_ledger_service(request: Request) -> LedgerService:
+async def get_ledger_service(request: Request) -> LedgerService:
     return request.app.state.ledger
 
 
-def get_storage_backend(request: Request) -> LedgerStorage:
+async def get_storage_backend(request: Request) -> LedgerStorage:
     return request.app.state.storage
 
 
-def get_nonce_cache(request: Request) -> NonceCache:
+async def get_nonce_cache(request: Request) -> NonceCache:
     return request.app.state.nonce_cache
 
 
-def get_bid_response_service(request: Request) -> BidResponseService:
+async def get_bid_response_service(request: Request) -> BidResponseService:
     return request.app.state.bid_response_service
 
 
-def get_weave_service(request: Request) -> WeaveService:
+async def get_weave_service(request: Request) -> WeaveService:
     return request.app.state.weave_service
 
 
+@dataclass(frozen=True)
+class AuctionDeps:
+    runner: AuctionRunner
+    validate_platform_request: Callable[[Any], None]
+    validate_context_request: Callable[[Any], None]
+    validate_auction_result: Callable[[Any], None]
+    settings: ServerConfig
+
+
+@dataclass(frozen=True)
+class BidResponseDeps:
+    validate_bid: Callable[[Any], None]
+    service: BidResponseService
+
+
+# Hot endpoints resolve their services through one dependency each rather
+# than one resolver pass per service. The bundles, including the bound schema
+# validators, are built once at startup.
+async def get_auction_deps(request: Request) -> AuctionDeps:
+    return request.app.state.auction_deps
+
+
+async def get_bid_response_deps(request: Request) -> BidResponseDeps:
+    return request.app.state.bid_response_deps
+
+
 # Routes ---------------------------------------------------------------------
 
 
@@ -149,7 +213,7 @@ async def root(settings: ServerConfig = Depends(get_server_settings)) -> dict[st
         },
         "auction": {
             "window_ms": settings.auction.window_ms,
-            "distribution_backend": settings.auction.distribution.get("backend", "local"),
+            "distribution_backend": settings.auction.distribution_backend,
         },
     }
 
@@ -162,48 +226,46 @@ async def ping() -> dict[str, Any]:
 @app.post("/aip/context", tags=["platform"])
 async def run_auction(
     payload: dict[str, Any] = Body(...),
-    runner: AuctionRunner = Depends(get_auction_runner),
-    schemas: SchemaRegistry = Depends(get_schema_service),
-    settings: ServerConfig = Depends(get_server_settings),
+    deps: AuctionDeps = Depends(get_auction_deps),
 ) -> dict[str, Any]:
     try:
-        schemas.validate("platform_request", payload)
+        deps.validate_platform_request(payload)
     except ValidationError as exc:
         raise HTTPException(status_code=422, detail=str(exc.message)) from exc
     try:
-        context_request = build_context_request(payload, settings)
-        schemas.validate("context_request", context_request)
+        context_request = build_context_request(payload, deps.settings)
+        deps.validate_context_request(context_request)
     except ValidationError as exc:
         raise HTTPException(
             status_code=500, detail=f"context_request mapping failed: {exc.message}"
         ) from exc
-    result = await runner.run(context_request)
+    result = await deps.runner.run(context_request)
     try:
         response = format_auction_result(result)
     except ValueError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
-    try:
-        schemas.validate("auction_result", response)
-    except (ValidationError, ValueError) as exc:
-        raise HTTPException(status_code=500, detail=f"invalid auction_result: {exc}") from exc
+    if deps.settings.validation.validate_responses:
+        try:
+            deps.validate_auction_result(response)
+        except (ValidationError, ValueError) as exc:
+            raise HTTPException(status_code=500, detail=f"invalid auction_result: {exc}") from exc
     return response
 
 
 @app.post("/aip/bid-response", tags=["auction"], status_code=status.HTTP_202_ACCEPTED)
 async def submit_bid_response(
     payload: dict[str, Any] = Body(...),
-    schemas: SchemaRegistry = Depends(get_schema_service),
-    service: BidResponseService = Depends(get_bid_response_service),
+    deps: BidResponseDeps = Depends(get_bid_response_deps),
 ) -> dict[str, str]:
     bid_payload = payload.get("bid")
     if not isinstance(bid_payload, dict):
         raise HTTPException(status_code=422, detail="bid payload is required")
     try:
-        schemas.validate("bid", bid_payload)
+        deps.validate_bid(bid_payload)
     except ValidationError as exc:
         raise HTTPException(status_code=422, detail=str(exc.message)) from exc
     try:
-        await service.submit(payload)
+        await deps.service.submit(payload)
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     return {"status": "accepted"}
@@ -258,15 +320,31 @@ async def get_weave_recommendations(
         return result
     except Exception as exc:
         # Log error and return 500
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Error in weave recommendations endpoint: {exc}", exc_info=True)
+        logger.exception("Error in weave recommendations endpoint: %s", exc)
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(exc)}"
         ) from exc
 
 
+@app.get("/v1/weave/recommendations/{session_id}/{message_id}", tags=["weave"])
+async def poll_weave_recommendation(
+    session_id: str,
+    message_id: str,
+    weave_service: WeaveService = Depends(get_weave_service),
+) -> dict[str, Any]:
+    """
+    Polling alias for an existing Weave recommendation.
+
+    Reads the cached state straight from storage without a request body and never
+    starts an auction; POST /v1/weave/recommendations remains the create path.
+    """
+    result = await weave_service.get_cached(session_id, message_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="recommendation not found")
+    return result
+
+
 @app.post("/aip/events", tags=["events"], status_code=status.HTTP_202_ACCEPTED)
 async def ingest_event(
     payload: dict[str, Any] = Body(...),
@@ -276,35 +354,26 @@ async def ingest_event(
         await event_service.ingest(payload)
     except (ValidationError, ValueError) as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
-    return {
-        "status": "accepted",
-        "serve_token": payload.get("serve_token"),
-        "event_type": payload.get("event_type"),
-    }
+    response = _EVENT_ACCEPTED.copy()
+    response["serve_token"] = payload.get("serve_token")
+    response["event_type"] = payload.get("event_type")
+    return response
 
 
 def format_auction_result(record: dict[str, Any]) -> dict[str, Any]:
     serve_token = record.get("serve_token") or record.get("record_id")
     auction_id = record.get("auction_id") or record.get("context", {}).get("context_id")
-    ttl_source = (
-        (record.get("winner") or {}).get("bid", {}).get("ttl_ms")
-        or (record.get("winner") or {}).get("ttl_ms")
-        or 60000
-    )
-    ttl_ms = max(int(ttl_source or 60000), 1000)
-    response: dict[str, Any] = {
-        "auction_id": auction_id,
-        "serve_token": serve_token,
-        "ttl_ms": ttl_ms,
-    }
-    if record.get("no_bid"):
-        response["no_bid"] = True
-        return response
     winner_payload = record.get("winner") or {}
-    if not winner_payload:
-        response["no_bid"] = True
-        return response
     bid_payload = winner_payload.get("bid") or winner_payload
+    ttl_source = bid_payload.get("ttl_ms") or winner_payload.get("ttl_ms") or 60000
+    ttl_ms = max(int(ttl_source), 1000)
+    if record.get("no_bid") or not winner_payload:
+        return {
+            "auction_id": auction_id,
+            "serve_token": serve_token,
+            "ttl_ms": ttl_ms,
+            "no_bid": True,
+        }
     brand_agent_id = (
         bid_payload.get("brand_agent_id")
         or winner_payload.get("brand_agent_id")
@@ -313,8 +382,7 @@ def format_auction_result(record: dict[str, Any]) -> dict[str, Any]:
     if not brand_agent_id:
         raise ValueError("winner payload missing brand_agent_id")
     pricing_vector = bid_payload.get("pricing") or {}
-    preferred_unit = determine_preferred_unit(bid_payload, pricing_vector)
-    reserved_amount = price_for_unit(preferred_unit, pricing_vector)
+    preferred_unit, reserved_amount = _preferred_unit_price(bid_payload, pricing_vector)
     if reserved_amount is None:
         raise ValueError("winner pricing missing reserved amount")
     winner_block: dict[str, Any] = {
@@ -338,31 +406,52 @@ def format_auction_result(record: dict[str, Any]) -> dict[str, Any]:
         winner_block["campaign_id"] = campaign_id
     if product_id:
         winner_block["product_id"] = product_id
-    response["winner"] = winner_block
     # Vendor extensions remain inside their namespaces and pass through untouched.
-    descriptions = creative_input.get("descriptions") or []
-    value_props = creative_input.get("value_props") or []
-    resource_urls = creative_input.get("resource_urls") or []
-    render = {
-        "label": "[Ad]",
-        "title": creative_input.get("product_name") or creative_input.get("brand_name"),
-        "body": descriptions[0] if descriptions else None,
-        "cta": value_props[0] if value_props else None,
-        "url": resource_urls[0] if resource_urls else None,
+    render: dict[str, Any] = {"label": "[Ad]"}
+    title = creative_input.get("product_name") or creative_input.get("brand_name")
+    if title is not None:
+        render["title"] = title
+    descriptions = creative_input.get("descriptions")
+    if descriptions and descriptions[0] is not None:
+        render["body"] = descriptions[0]
+    value_props = creative_input.get("value_props")
+    if value_props and value_props[0] is not None:
+        render["cta"] = value_props[0]
+    resource_urls = creative_input.get("resource_urls")
+    if resource_urls and resource_urls[0] is not None:
+        render["url"] = resource_urls[0]
+    return {
+        "auction_id": auction_id,
+        "serve_token": serve_token,
+        "ttl_ms": ttl_ms,
+        "winner": winner_block,
+        "render": render,
     }
-    response["render"] = {k: v for k, v in render.items() if v is not None}
-    return response
 
 
 def determine_preferred_unit(bid_payload: dict[str, Any], pricing: dict[str, Any]) -> str:
+    return _preferred_unit_price(bid_payload, pricing)[0]
+
+
+def _preferred_unit_price(
+    bid_payload: dict[str, Any], pricing: dict[str, Any]
+) -> tuple[str, int | None]:
+    """Pick the billing unit and its price in cents, parsing each price at most once."""
     unit = (bid_payload.get("preferred_unit") or "").upper()
-    if unit in {"CPX", "CPC", "CPA"} and price_for_unit(unit, pricing) is not None:
-        return unit
+    if unit in ("CPX", "CPC", "CPA"):
+        cents = price_for_unit(unit, pricing)
+        if cents is not None:
+            return unit, cents
     if pricing.get("cpa") is not None:
-        return "CPA"
-    if pricing.get("cpc") is not None:
-        return "CPC"
-    return "CPX"
+        fallback = "CPA"
+    elif pricing.get("cpc") is not None:
+        fallback = "CPC"
+    else:
+        fallback = "CPX"
+    if fallback == unit:
+        # Already parsed above and found no usable price.
+        return fallback, None
+    return fallback, price_for_unit(fallback, pricing)
 
 
 def price_for_unit(unit: str, pricing: dict[str, Any]) -> int | None:
@@ -373,32 +462,50 @@ def price_for_unit(unit: str, pricing: dict[str, Any]) -> int | None:
 def format_price_cents(value: Any) -> int | None:
     if value is None:
         return None
+    if type(value) is int:
+        # Integers carry no decimal point and are taken as cents already.
+        return value
     value_str = str(value).strip()
     if not value_str:
         return None
+    match = _DECIMAL_RE.fullmatch(value_str)
+    if match is None:
+        return _decimal_price_cents(value_str)
+    sign, whole, frac = match.groups()
+    if frac is None:
+        cents = int(whole)
+    else:
+        # Scaled-integer parse of "d.ddd"; rounds half-even like Decimal.quantize.
+        frac = frac.ljust(2, "0")
+        cents = int(whole or "0") * 100 + int(frac[:2])
+        rest = frac[2:].rstrip("0")
+        if rest and (rest > "5" or (rest == "5" and cents % 2)):
+            cents += 1
+    return -cents if sign == "-" else cents
+
+
+def _decimal_price_cents(value_str: str) -> int | None:
     try:
         if "." in value_str:
-            cents = (Decimal(value_str) * 100).quantize(Decimal("1"))
+            cents = (Decimal(value_str) * _HUNDRED).quantize(_WHOLE_CENTS)
         else:
             cents = Decimal(value_str)
-    except (InvalidOperation, ValueError, TypeError):
+        return int(cents)
+    except (InvalidOperation, ValueError, TypeError, OverflowError):
         return None
-    return int(cents)
 
 
 def build_context_request(platform_request: dict[str, Any], settings: ServerConfig) -> dict[str, Any]:
     """Map the external PlatformRequest schema to the ContextRequest schema used for bidder fanout."""
-    context_id = platform_request.get("request_id") or f"ctx_{uuid4().hex}"
-    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
     context_request: dict[str, Any] = {
-        "context_id": context_id,
+        "context_id": platform_request.get("request_id") or f"ctx_{secrets.token_hex(16)}",
         "session_id": platform_request["session_id"],
         "operator_id": settings.operator.operator_id,
         "platform_id": platform_request["platform_id"],
         "query_text": platform_request["query_text"],
         "locale": platform_request["locale"],
         "geo": platform_request["geo"],
-        "timestamp": timestamp,
+        "timestamp": _utc_timestamp(),
         "intent": build_intent(platform_request),
         "allowed_formats": list(settings.operator.allowed_formats) or ["weave"],
         "auth": platform_request["auth"],
@@ -412,6 +519,19 @@ def build_context_request(platform_request: dict[str, Any], settings: ServerConf
     return context_request
 
 
+_timestamp_prefix: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """RFC 3339 UTC timestamp; the date/time prefix is formatted once per second."""
+    global _timestamp_prefix
+    now = time.time()
+    second = int(now)
+    if _timestamp_prefix[0] != second:
+        _timestamp_prefix = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    return f"{_timestamp_prefix[1]}.{int((now - second) * 1_000_000):06d}Z"
+
+
 def extract_verticals(platform_request: dict[str, Any]) -> list[str]:
     features = platform_request.get("features")
     topics: list[str] = []
@@ -434,20 +554,17 @@ def build_intent(platform_request: dict[str, Any]) -> dict[str, Any]:
 
 
 def infer_intent_type(platform_request: dict[str, Any]) -> str:
-    try:
-        cpx_floor = float(platform_request.get("cpx_floor", 0))
-    except (TypeError, ValueError):
-        cpx_floor = 0.0
+    cpx_floor = platform_request.get("cpx_floor", 0)
+    if type(cpx_floor) not in (int, float):
+        try:
+            cpx_floor = float(cpx_floor)
+        except (TypeError, ValueError):
+            cpx_floor = 0.0
     return "commercial" if cpx_floor > 0 else "informational"
 
 
 def infer_decision_phase(platform_request: dict[str, Any], messages: list[Any]) -> str:
-    length = len(messages)
-    if length >= 4:
-        return "decide"
-    if length == 3:
-        return "compare"
-    return "research"
+    return _DECISION_PHASES[min(len(messages), 4)]
 
 
 def summarize_context(platform_request: dict[str, Any]) -> str:
@@ -459,7 +576,9 @@ def summarize_context(platform_request: dict[str, Any]) -> str:
 def normalize_extensions(platform_request: dict[str, Any]) -> dict[str, Any]:
     """Preserve vendor-namespaced metadata and attach platform metadata for downstream bidders."""
     metadata = platform_request.get("metadata")
-    result = deepcopy(metadata) if isinstance(metadata, dict) else {}
+    # Only the platform's own bucket is mutated below; other vendors' extensions
+    # pass through by reference.
+    result = dict(metadata) if isinstance(metadata, dict) else {}
     vendor_id = slug_vendor_id(platform_request.get("platform_id", "platform"))
     platform_metadata: dict[str, Any] = {}
     for key in ("model", "messages", "platform_surface"):
@@ -470,9 +589,8 @@ def normalize_extensions(platform_request: dict[str, Any]) -> dict[str, Any]:
         platform_metadata["cpx_floor"] = platform_request.get("cpx_floor")
     if platform_metadata:
         bucket = result.get(vendor_id)
-        if not isinstance(bucket, dict):
-            bucket = {}
-            result[vendor_id] = bucket
+        bucket = dict(bucket) if isinstance(bucket, dict) else {}
+        result[vendor_id] = bucket
         existing_meta = bucket.get("platform_request") if isinstance(bucket.get("platform_request"), dict) else {}
         bucket["platform_request"] = {**existing_meta, **platform_metadata}
     return result
@@ -481,6 +599,9 @@ def normalize_extensions(platform_request: dict[str, Any]) -> dict[str, Any]:
 def slug_vendor_id(platform_id: str) -> str:
     if not platform_id:
         return "platform"
-    slug = re.sub(r"[^a-z0-9_-]", "-", platform_id.lower())
+    slug = platform_id.lower()
+    # Most platform ids are already clean slugs; only run the regex otherwise.
+    if not (slug.isascii() and slug.replace("_", "").replace("-", "").isalnum()):
+        slug = _SLUG_RE.sub("-", slug)
     slug = slug.strip("-")
     return slug or "platform"
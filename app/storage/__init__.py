@@ -6,22 +6,36 @@ from typing import Protocol
 
 from ..config import ServerConfig
 from .in_memory import InMemoryStorage
-from .postgres import PostgresStorage
-from .redis import RedisStorage
-from .firestore import FirestoreStorage
 
 
 class LedgerStorage(Protocol):
     async def create_record(self, record: dict) -> dict: ...
 
+    async def create_records(self, records: list[dict]) -> list[dict]: ...
+
     async def update_record(self, record_id: str, updates: dict) -> dict: ...
 
-    async def get_record(self, record_id: str) -> dict: ...
+    async def get_record(self, record_id: str, *, fresh: bool = False) -> dict:
+        """Load a record; ``fresh`` skips any read cache (backends without one ignore it)."""
+        ...
 
     async def append_event(self, record_id: str, event: dict) -> dict: ...
 
+    async def apply_event(self, record_id: str, updates: dict, event: dict) -> dict:
+        """Apply ``updates`` and append ``event`` to a record in a single write."""
+        ...
+
     async def list_records(self) -> list[dict]: ...
 
+    async def list_records_page(
+        self, *, cursor: str | None = None, limit: int = 500
+    ) -> tuple[list[dict], str | None]:
+        """Return up to about ``limit`` records and an opaque cursor for the next page.
+
+        The cursor is ``None`` once every record has been returned.
+        """
+        ...
+
 
 class RecommendationStorage(Protocol):
     """Storage protocol for Weave recommendations."""
@@ -42,16 +56,37 @@ class RecommendationStorage(Protocol):
         """Update an existing recommendation record."""
         ...
 
+    async def list_session_recommendations(self, session_id: str) -> list[dict]:
+        """List every recommendation stored for ``session_id``."""
+        ...
+
 
 def build_storage(config: ServerConfig) -> LedgerStorage:
-    backend = config.ledger.backend
     options = dict(config.ledger.options)
+    cache_ttl = options.pop("cache_ttl", None)
+    cache_size = options.pop("cache_size", 10_000)
+    storage = _build_backend(config.ledger.backend, options)
+    if cache_ttl:
+        from .cached import CachedStorage
+
+        return CachedStorage(storage, ttl=float(cache_ttl), maxsize=int(cache_size))
+    return storage
+
+
+def _build_backend(backend: str, options: dict) -> LedgerStorage:
     if backend == "in_memory":
         return InMemoryStorage()
+    # Client libraries are only imported for the backend actually configured.
     if backend == "redis":
+        from .redis import RedisStorage
+
         return RedisStorage(**options)
     if backend == "postgres":
+        from .postgres import PostgresStorage
+
         return PostgresStorage(**options)
     if backend == "firestore":
+        from .firestore import FirestoreStorage
+
         return FirestoreStorage(**options)
     raise ValueError(f"unknown storage backend {backend}")
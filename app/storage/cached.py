@@ -0,0 +1,151 @@
+"""Read-through TTL cache in front of a storage backend."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+import orjson
+
+
+class _TTLCache:
+    """Bounded LRU of orjson snapshots with per-entry expiry."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, blob = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        # Hand out a fresh copy so callers can't mutate the cached value.
+        return orjson.loads(blob)
+
+    def put(self, key: Hashable, value: dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, orjson.dumps(value))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+
+class CachedStorage:
+    """Caches ``get_record``/``get_recommendation`` and writes through on updates.
+
+    Entries only reflect writes made through this process, so ``ttl`` bounds how
+    stale a read can be when several servers share one backend.
+    """
+
+    def __init__(self, backend: Any, *, ttl: float, maxsize: int = 10_000) -> None:
+        self._backend = backend
+        self._records = _TTLCache(maxsize, ttl)
+        self._recommendations = _TTLCache(maxsize, ttl)
+        # Bumped on every write; a miss only fills the cache if no write
+        # landed while the backend read was in flight.
+        self._writes = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._backend, name)
+
+    def _store_record(self, record: dict[str, Any]) -> dict[str, Any]:
+        self._writes += 1
+        self._records.put(record["record_id"], record)
+        return record
+
+    async def create_record(self, record: dict[str, Any]) -> dict[str, Any]:
+        return self._store_record(await self._backend.create_record(record))
+
+    async def create_records(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        created = await self._backend.create_records(records)
+        return [self._store_record(record) for record in created]
+
+    async def get_record(self, record_id: str, *, fresh: bool = False) -> dict[str, Any]:
+        record = None if fresh else self._records.get(record_id)
+        if record is not None:
+            return record
+        writes = self._writes
+        record = await self._backend.get_record(record_id)
+        if writes == self._writes:
+            self._records.put(record_id, record)
+        return record
+
+    async def update_record(self, record_id: str, updates: dict[str, Any]) -> dict[str, Any]:
+        return await self._write_record(record_id, self._backend.update_record(record_id, updates))
+
+    async def append_event(self, record_id: str, event: dict[str, Any]) -> dict[str, Any]:
+        return await self._write_record(record_id, self._backend.append_event(record_id, event))
+
+    async def apply_event(
+        self, record_id: str, updates: dict[str, Any], event: dict[str, Any]
+    ) -> dict[str, Any]:
+        return await self._write_record(
+            record_id, self._backend.apply_event(record_id, updates, event)
+        )
+
+    async def _write_record(self, record_id: str, write) -> dict[str, Any]:
+        self._writes += 1
+        try:
+            record = await write
+        except BaseException:
+            self._records.discard(record_id)
+            raise
+        return self._store_record(record)
+
+    async def list_records(self) -> list[dict[str, Any]]:
+        return await self._backend.list_records()
+
+    async def list_records_page(
+        self, *, cursor: str | None = None, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        return await self._backend.list_records_page(cursor=cursor, limit=limit)
+
+    async def get_recommendation(
+        self, session_id: str, message_id: str
+    ) -> dict[str, Any] | None:
+        key = (session_id, message_id)
+        recommendation = self._recommendations.get(key)
+        if recommendation is not None:
+            return recommendation
+        writes = self._writes
+        recommendation = await self._backend.get_recommendation(session_id, message_id)
+        # Misses aren't cached: the document may be created by another server.
+        if recommendation is not None and writes == self._writes:
+            self._recommendations.put(key, recommendation)
+        return recommendation
+
+    async def create_recommendation(self, recommendation: dict[str, Any]) -> dict[str, Any]:
+        key = (recommendation["session_id"], recommendation["message_id"])
+        return await self._write_recommendation(
+            key, self._backend.create_recommendation(recommendation)
+        )
+
+    async def update_recommendation(
+        self, session_id: str, message_id: str, updates: dict[str, Any]
+    ) -> dict[str, Any]:
+        return await self._write_recommendation(
+            (session_id, message_id),
+            self._backend.update_recommendation(session_id, message_id, updates),
+        )
+
+    async def list_session_recommendations(self, session_id: str) -> list[dict[str, Any]]:
+        return await self._backend.list_session_recommendations(session_id)
+
+    async def _write_recommendation(self, key: tuple[str, str], write) -> dict[str, Any]:
+        self._writes += 1
+        try:
+            recommendation = await write
+        except BaseException:
+            self._recommendations.discard(key)
+            raise
+        self._recommendations.put(key, recommendation)
+        return recommendation
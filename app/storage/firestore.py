@@ -5,9 +5,14 @@ from __future__ import annotations
 import asyncio
 from typing import Any, Callable
 
+from google.api_core.exceptions import NotFound
 from google.cloud import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
 from google.oauth2 import service_account
 
+# Documents per write batch; Firestore allows up to 500 writes per commit.
+_BATCH_SIZE = 50
+
 
 class FirestoreStorage:
     def __init__(
@@ -25,44 +30,80 @@ class FirestoreStorage:
             client_kwargs["credentials"] = service_account.Credentials.from_service_account_file(
                 credentials_path
             )
-        self._client = firestore.Client(**client_kwargs)
-        self._collection_name = collection
-        self._recommendations_collection_name = recommendations_collection
-
-    def _collection(self):
-        return self._client.collection(self._collection_name)
-
-    def _recommendations_collection(self):
-        return self._client.collection(self._recommendations_collection_name)
-
-    async def _run(self, func: Callable, *args, **kwargs):
-        return await asyncio.to_thread(func, *args, **kwargs)
+        self._client = firestore.AsyncClient(**client_kwargs)
+        # Collection references are immutable; build them once, not per call.
+        self._records = self._client.collection(collection)
+        self._recommendations = self._client.collection(recommendations_collection)
 
     async def create_record(self, record: dict[str, Any]) -> dict[str, Any]:
-        await self._run(self._collection().document(record["record_id"]).set, record)
+        await self._records.document(record["record_id"]).set(record)
         return record
 
-    async def get_record(self, record_id: str) -> dict[str, Any]:
-        doc = await self._run(self._collection().document(record_id).get)
+    async def create_records(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # One commit per chunk instead of one round-trip per document; the
+        # chunks are committed concurrently.
+        batches = []
+        for start in range(0, len(records), _BATCH_SIZE):
+            batch = self._client.batch()
+            for record in records[start : start + _BATCH_SIZE]:
+                batch.set(self._records.document(record["record_id"]), record)
+            batches.append(batch)
+        await asyncio.gather(*(batch.commit() for batch in batches))
+        return records
+
+    async def get_record(self, record_id: str, *, fresh: bool = False) -> dict[str, Any]:
+        doc = await self._records.document(record_id).get()
         if not doc.exists:
             raise KeyError(record_id)
         return doc.to_dict()
 
     async def update_record(self, record_id: str, updates: dict[str, Any]) -> dict[str, Any]:
-        record = await self.get_record(record_id)
-        record.update(updates)
-        await self._run(self._collection().document(record_id).set, record)
-        return record
+        return await self._modify_record(record_id, lambda record: record.update(updates))
 
     async def append_event(self, record_id: str, event: dict[str, Any]) -> dict[str, Any]:
-        record = await self.get_record(record_id)
-        record.setdefault("events", []).append(event)
-        await self._run(self._collection().document(record_id).set, record)
-        return record
+        return await self._modify_record(
+            record_id, lambda record: record.setdefault("events", []).append(event)
+        )
+
+    async def apply_event(
+        self, record_id: str, updates: dict[str, Any], event: dict[str, Any]
+    ) -> dict[str, Any]:
+        def mutate(record: dict[str, Any]) -> None:
+            record.update(updates)
+            record.setdefault("events", []).append(event)
+
+        return await self._modify_record(record_id, mutate)
+
+    async def _modify_record(
+        self, record_id: str, mutate: Callable[[dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """Read-modify-write in a transaction; Firestore retries it on contention."""
+        ref = self._records.document(record_id)
+
+        @firestore.async_transactional
+        async def modify(transaction) -> dict[str, Any]:
+            doc = await ref.get(transaction=transaction)
+            if not doc.exists:
+                raise KeyError(record_id)
+            record = doc.to_dict()
+            mutate(record)
+            transaction.set(ref, record)
+            return record
+
+        return await modify(self._client.transaction())
 
     async def list_records(self) -> list[dict[str, Any]]:
-        docs = await self._run(lambda: list(self._collection().stream()))
-        return [doc.to_dict() for doc in docs]
+        return [doc.to_dict() async for doc in self._records.stream()]
+
+    async def list_records_page(
+        self, *, cursor: str | None = None, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        query = self._records.order_by("record_id")
+        if cursor is not None:
+            query = query.start_after({"record_id": cursor})
+        records = [doc.to_dict() async for doc in query.limit(limit).stream()]
+        next_cursor = records[-1]["record_id"] if len(records) == limit else None
+        return records, next_cursor
 
     # Recommendation storage methods
 
@@ -75,7 +116,7 @@ class FirestoreStorage:
     ) -> dict[str, Any] | None:
         """Get recommendation by session_id and message_id."""
         doc_id = self._recommendation_doc_id(session_id, message_id)
-        doc = await self._run(self._recommendations_collection().document(doc_id).get)
+        doc = await self._recommendations.document(doc_id).get()
         if not doc.exists:
             return None
         return doc.to_dict()
@@ -85,21 +126,28 @@ class FirestoreStorage:
         doc_id = self._recommendation_doc_id(
             recommendation["session_id"], recommendation["message_id"]
         )
-        await self._run(
-            self._recommendations_collection().document(doc_id).set, recommendation
-        )
+        await self._recommendations.document(doc_id).set(recommendation)
         return recommendation
 
     async def update_recommendation(
         self, session_id: str, message_id: str, updates: dict[str, Any]
     ) -> dict[str, Any]:
         """Update an existing recommendation record."""
-        recommendation = await self.get_recommendation(session_id, message_id)
-        if recommendation is None:
-            raise KeyError(f"recommendation ({session_id}, {message_id}) not found")
-        recommendation.update(updates)
-        doc_id = self._recommendation_doc_id(session_id, message_id)
-        await self._run(
-            self._recommendations_collection().document(doc_id).set, recommendation
+        # Partial server-side merge: concurrent updaters no longer overwrite
+        # each other's fields with a stale copy of the document.
+        doc_ref = self._recommendations.document(
+            self._recommendation_doc_id(session_id, message_id)
         )
-        return recommendation
+        try:
+            await doc_ref.update(updates)
+        except NotFound as exc:
+            raise KeyError(f"recommendation ({session_id}, {message_id}) not found") from exc
+        doc = await doc_ref.get()
+        return doc.to_dict()
+
+    async def list_session_recommendations(self, session_id: str) -> list[dict[str, Any]]:
+        """List every recommendation stored for ``session_id``."""
+        # Equality filter on an automatically indexed field: reads only the
+        # session's documents, without re-keying existing recommendations.
+        query = self._recommendations.where(filter=FieldFilter("session_id", "==", session_id))
+        return [doc.to_dict() async for doc in query.stream()]
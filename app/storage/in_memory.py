@@ -2,46 +2,75 @@
 
 from __future__ import annotations
 
-import asyncio
-from copy import deepcopy
+from bisect import bisect_right
 from typing import Any
 
+import orjson
+
 
 class InMemoryStorage:
     def __init__(self) -> None:
-        self._records: dict[str, dict[str, Any]] = {}
-        self._recommendations: dict[tuple[str, str], dict[str, Any]] = {}
-        self._lock = asyncio.Lock()
+        # Documents are kept as orjson bytes: every read is a fresh copy from one
+        # C-level parse rather than a deepcopy, with the same JSON round-trip
+        # semantics as the persistent backends. No method awaits, so each runs
+        # atomically on the event loop without a lock.
+        self._records: dict[str, bytes] = {}
+        self._recommendations: dict[tuple[str, str], bytes] = {}
 
     async def create_record(self, record: dict[str, Any]) -> dict[str, Any]:
-        async with self._lock:
-            self._records[record["record_id"]] = deepcopy(record)
-            return deepcopy(record)
+        blob = orjson.dumps(record)
+        self._records[record["record_id"]] = blob
+        return orjson.loads(blob)
+
+    async def create_records(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [await self.create_record(record) for record in records]
 
     async def update_record(self, record_id: str, updates: dict[str, Any]) -> dict[str, Any]:
-        async with self._lock:
-            if record_id not in self._records:
-                raise KeyError(record_id)
-            self._records[record_id].update(updates)
-            return deepcopy(self._records[record_id])
-
-    async def get_record(self, record_id: str) -> dict[str, Any]:
-        async with self._lock:
-            try:
-                return deepcopy(self._records[record_id])
-            except KeyError as exc:
-                raise KeyError(f"record {record_id} not found") from exc
+        if record_id not in self._records:
+            raise KeyError(record_id)
+        record = orjson.loads(self._records[record_id])
+        record.update(updates)
+        self._records[record_id] = orjson.dumps(record)
+        return record
+
+    async def get_record(self, record_id: str, *, fresh: bool = False) -> dict[str, Any]:
+        try:
+            return orjson.loads(self._records[record_id])
+        except KeyError as exc:
+            raise KeyError(f"record {record_id} not found") from exc
 
     async def append_event(self, record_id: str, event: dict[str, Any]) -> dict[str, Any]:
-        async with self._lock:
-            if record_id not in self._records:
-                raise KeyError(record_id)
-            self._records[record_id].setdefault("events", []).append(deepcopy(event))
-            return deepcopy(self._records[record_id])
+        if record_id not in self._records:
+            raise KeyError(record_id)
+        record = orjson.loads(self._records[record_id])
+        record.setdefault("events", []).append(event)
+        blob = orjson.dumps(record)
+        self._records[record_id] = blob
+        return orjson.loads(blob)
+
+    async def apply_event(
+        self, record_id: str, updates: dict[str, Any], event: dict[str, Any]
+    ) -> dict[str, Any]:
+        if record_id not in self._records:
+            raise KeyError(record_id)
+        record = orjson.loads(self._records[record_id])
+        record.update(updates)
+        record.setdefault("events", []).append(event)
+        blob = orjson.dumps(record)
+        self._records[record_id] = blob
+        return orjson.loads(blob)
 
     async def list_records(self) -> list[dict[str, Any]]:
-        async with self._lock:
-            return [deepcopy(record) for record in self._records.values()]
+        return [orjson.loads(blob) for blob in self._records.values()]
+
+    async def list_records_page(
+        self, *, cursor: str | None = None, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        record_ids = sorted(self._records)
+        start = bisect_right(record_ids, cursor) if cursor is not None else 0
+        page = record_ids[start : start + limit]
+        next_cursor = page[-1] if start + limit < len(record_ids) else None
+        return [orjson.loads(self._records[rid]) for rid in page], next_cursor
 
     # Recommendation storage methods
 
@@ -49,25 +78,33 @@ class InMemoryStorage:
         self, session_id: str, message_id: str
     ) -> dict[str, Any] | None:
         """Get recommendation by session_id and message_id."""
-        async with self._lock:
-            key = (session_id, message_id)
-            rec = self._recommendations.get(key)
-            return deepcopy(rec) if rec else None
+        key = (session_id, message_id)
+        blob = self._recommendations.get(key)
+        return orjson.loads(blob) if blob else None
 
     async def create_recommendation(self, recommendation: dict[str, Any]) -> dict[str, Any]:
         """Create a new recommendation record."""
-        async with self._lock:
-            key = (recommendation["session_id"], recommendation["message_id"])
-            self._recommendations[key] = deepcopy(recommendation)
-            return deepcopy(recommendation)
+        key = (recommendation["session_id"], recommendation["message_id"])
+        blob = orjson.dumps(recommendation)
+        self._recommendations[key] = blob
+        return orjson.loads(blob)
 
     async def update_recommendation(
         self, session_id: str, message_id: str, updates: dict[str, Any]
     ) -> dict[str, Any]:
         """Update an existing recommendation record."""
-        async with self._lock:
-            key = (session_id, message_id)
-            if key not in self._recommendations:
-                raise KeyError(f"recommendation ({session_id}, {message_id}) not found")
-            self._recommendations[key].update(updates)
-            return deepcopy(self._recommendations[key])
+        key = (session_id, message_id)
+        if key not in self._recommendations:
+            raise KeyError(f"recommendation ({session_id}, {message_id}) not found")
+        recommendation = orjson.loads(self._recommendations[key])
+        recommendation.update(updates)
+        self._recommendations[key] = orjson.dumps(recommendation)
+        return recommendation
+
+    async def list_session_recommendations(self, session_id: str) -> list[dict[str, Any]]:
+        """List every recommendation stored for ``session_id``."""
+        return [
+            orjson.loads(blob)
+            for (session, _), blob in self._recommendations.items()
+            if session == session_id
+        ]
@@ -8,6 +8,29 @@ import asyncpg
 import orjson
 
 
+_JSONB_BINARY_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    return _JSONB_BINARY_VERSION + orjson.dumps(value)
+
+
+def _decode_jsonb(value: bytes) -> Any:
+    return orjson.loads(value[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    # Exchange JSONB in binary form through orjson so documents travel as
+    # Python values without an extra text encode/decode on either side.
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
 class PostgresStorage:
     def __init__(self, *, dsn: str | None = None, **connect_kwargs: Any) -> None:
         if not dsn and not connect_kwargs:
@@ -16,19 +39,19 @@ class PostgresStorage:
         self._connect_kwargs = connect_kwargs
         self._pool: asyncpg.Pool | None = None
 
-    def _encode(self, payload: dict[str, Any]) -> str:
-        return orjson.dumps(payload).decode()
-
-    def _decode(self, value: Any) -> dict[str, Any]:
-        if isinstance(value, (bytes, bytearray)):
-            value = value.decode()
-        if isinstance(value, str):
-            return orjson.loads(value)
-        return value
-
     async def _ensure_pool(self) -> asyncpg.Pool:
         if self._pool is None:
-            self._pool = await asyncpg.create_pool(dsn=self._dsn, **self._connect_kwargs)
+            # Short point queries: keep more statements prepared per connection
+            # and skip JIT compilation, which only pays off for long analytics.
+            connect_kwargs = {"statement_cache_size": 1024, **self._connect_kwargs}
+            connect_kwargs["server_settings"] = {
+                "jit": "off",
+                "application_name": "aip-ledger",
+                **connect_kwargs.get("server_settings", {}),
+            }
+            self._pool = await asyncpg.create_pool(
+                dsn=self._dsn, init=_init_connection, **connect_kwargs
+            )
             async with self._pool.acquire() as conn:
                 await conn.execute(
                     """
@@ -60,23 +83,38 @@ class PostgresStorage:
             await conn.execute(
                 """INSERT INTO ledger_records(record_id, data) VALUES($1, $2)""",
                 record["record_id"],
-                self._encode(record),
+                record,
             )
         return record
 
+    async def create_records(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            # Binary COPY goes through the registered jsonb codec, so rows are
+            # streamed without per-row statement execution.
+            await conn.copy_records_to_table(
+                "ledger_records",
+                records=[(record["record_id"], record) for record in records],
+                columns=["record_id", "data"],
+            )
+        return records
+
     async def update_record(self, record_id: str, updates: dict[str, Any]) -> dict[str, Any]:
-        record = await self.get_record(record_id)
-        record.update(updates)
+        # Merge server-side: one round-trip and no lost updates between writers.
         pool = await self._ensure_pool()
         async with pool.acquire() as conn:
-            await conn.execute(
-                """UPDATE ledger_records SET data=$2 WHERE record_id=$1""",
+            row = await conn.fetchrow(
+                """UPDATE ledger_records SET data = data || $2::jsonb
+                   WHERE record_id=$1
+                   RETURNING data""",
                 record_id,
-                self._encode(record),
+                updates,
             )
-        return record
+        if not row:
+            raise KeyError(record_id)
+        return row["data"]
 
-    async def get_record(self, record_id: str) -> dict[str, Any]:
+    async def get_record(self, record_id: str, *, fresh: bool = False) -> dict[str, Any]:
         pool = await self._ensure_pool()
         async with pool.acquire() as conn:
             row = await conn.fetchrow(
@@ -85,25 +123,73 @@ class PostgresStorage:
             )
         if not row:
             raise KeyError(record_id)
-        return self._decode(row["data"])
+        return row["data"]
 
     async def append_event(self, record_id: str, event: dict[str, Any]) -> dict[str, Any]:
-        record = await self.get_record(record_id)
-        record.setdefault("events", []).append(event)
         pool = await self._ensure_pool()
         async with pool.acquire() as conn:
-            await conn.execute(
-                """UPDATE ledger_records SET data=$2 WHERE record_id=$1""",
+            row = await conn.fetchrow(
+                """UPDATE ledger_records
+                   SET data = jsonb_set(
+                       data, '{events}', COALESCE(data->'events', '[]'::jsonb) || $2::jsonb
+                   )
+                   WHERE record_id=$1
+                   RETURNING data""",
                 record_id,
-                self._encode(record),
+                [event],
             )
-        return record
+        if not row:
+            raise KeyError(record_id)
+        return row["data"]
+
+    async def apply_event(
+        self, record_id: str, updates: dict[str, Any], event: dict[str, Any]
+    ) -> dict[str, Any]:
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """UPDATE ledger_records
+                   SET data = (data || $2::jsonb) || jsonb_build_object(
+                       'events',
+                       COALESCE(data->'events', '[]'::jsonb) || jsonb_build_array($3::jsonb)
+                   )
+                   WHERE record_id=$1
+                   RETURNING data""",
+                record_id,
+                updates,
+                event,
+            )
+        if not row:
+            raise KeyError(record_id)
+        return row["data"]
 
     async def list_records(self) -> list[dict[str, Any]]:
         pool = await self._ensure_pool()
         async with pool.acquire() as conn:
             rows = await conn.fetch("SELECT data FROM ledger_records ORDER BY record_id")
-        return [self._decode(row["data"]) for row in rows]
+        return [row["data"] for row in rows]
+
+    async def list_records_page(
+        self, *, cursor: str | None = None, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        # Keyset pagination on the primary key: each page is an index range scan.
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            if cursor is None:
+                rows = await conn.fetch(
+                    """SELECT record_id, data FROM ledger_records
+                       ORDER BY record_id LIMIT $1""",
+                    limit,
+                )
+            else:
+                rows = await conn.fetch(
+                    """SELECT record_id, data FROM ledger_records
+                       WHERE record_id > $1 ORDER BY record_id LIMIT $2""",
+                    cursor,
+                    limit,
+                )
+        next_cursor = rows[-1]["record_id"] if len(rows) == limit else None
+        return [row["data"] for row in rows], next_cursor
 
     # Recommendation storage methods
 
@@ -120,7 +206,7 @@ class PostgresStorage:
             )
         if not row:
             return None
-        return self._decode(row["data"])
+        return row["data"]
 
     async def create_recommendation(self, recommendation: dict[str, Any]) -> dict[str, Any]:
         """Create a new recommendation record."""
@@ -130,7 +216,7 @@ class PostgresStorage:
                 """INSERT INTO recommendations(session_id, message_id, data) VALUES($1, $2, $3)""",
                 recommendation["session_id"],
                 recommendation["message_id"],
-                self._encode(recommendation),
+                recommendation,
             )
         return recommendation
 
@@ -138,17 +224,27 @@ class PostgresStorage:
         self, session_id: str, message_id: str, updates: dict[str, Any]
     ) -> dict[str, Any]:
         """Update an existing recommendation record."""
-        recommendation = await self.get_recommendation(session_id, message_id)
-        if recommendation is None:
-            raise KeyError(f"recommendation ({session_id}, {message_id}) not found")
-        recommendation.update(updates)
         pool = await self._ensure_pool()
         async with pool.acquire() as conn:
-            await conn.execute(
-                """UPDATE recommendations SET data=$3, updated_at=NOW()
-                   WHERE session_id=$1 AND message_id=$2""",
+            row = await conn.fetchrow(
+                """UPDATE recommendations SET data = data || $3::jsonb, updated_at=NOW()
+                   WHERE session_id=$1 AND message_id=$2
+                   RETURNING data""",
                 session_id,
                 message_id,
-                self._encode(recommendation),
+                updates,
             )
-        return recommendation
+        if not row:
+            raise KeyError(f"recommendation ({session_id}, {message_id}) not found")
+        return row["data"]
+
+    async def list_session_recommendations(self, session_id: str) -> list[dict[str, Any]]:
+        """List every recommendation stored for ``session_id``."""
+        # session_id leads the primary key, so this is an index range scan.
+        pool = await self._ensure_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """SELECT data FROM recommendations WHERE session_id=$1 ORDER BY message_id""",
+                session_id,
+            )
+        return [row["data"] for row in rows]
@@ -2,61 +2,176 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 import orjson
 from redis import asyncio as aioredis
+from redis.exceptions import WatchError
 
 
 class RedisStorage:
-    def __init__(self, *, url: str, prefix: str = "aip:ledger") -> None:
+    def __init__(
+        self,
+        *,
+        url: str,
+        prefix: str = "aip:ledger",
+        max_connections: int = 64,
+        health_check_interval: int = 30,
+    ) -> None:
         if not url:
             raise ValueError("redis url missing")
-        self._redis = aioredis.from_url(url)
+        # Bounded pool: bursts wait for a connection instead of opening new
+        # sockets without limit, and idle connections are pinged before reuse.
+        pool = aioredis.BlockingConnectionPool.from_url(
+            url,
+            max_connections=max_connections,
+            health_check_interval=health_check_interval,
+            socket_keepalive=True,
+            retry_on_timeout=True,
+        )
+        self._redis = aioredis.Redis(connection_pool=pool)
         self._prefix = prefix.rstrip(":")
-
-    def _record_key(self, record_id: str) -> str:
-        return f"{self._prefix}:record:{record_id}"
+        # Record keys are built on every read and for each id in list_records;
+        # concatenating bytes is cheaper than formatting a str per key.
+        self._record_prefix = f"{self._prefix}:record:".encode()
+        # Sorted set with every score 0, so members are ordered by id and
+        # pages can be read by keyset without SSCAN's repeated members.
+        self._record_ids = f"{self._prefix}:record_index".encode()
+        # Set once a full SCAN has indexed records written before the index
+        # existed; checked once per process.
+        self._record_ids_backfilled = f"{self._prefix}:record_index_backfilled".encode()
+        self._backfill_checked = False
+
+    async def aclose(self) -> None:
+        await self._redis.aclose(close_connection_pool=True)
+
+    def _record_key(self, record_id: str | bytes) -> bytes:
+        if isinstance(record_id, str):
+            record_id = record_id.encode()
+        return self._record_prefix + record_id
 
     def _recommendation_key(self, session_id: str, message_id: str) -> str:
         return f"{self._prefix}:recommendation:{session_id}:{message_id}"
 
+    def _session_recommendations_key(self, session_id: str) -> str:
+        return f"{self._prefix}:recommendation_ids:{session_id}"
+
     async def create_record(self, record: dict[str, Any]) -> dict[str, Any]:
         key = self._record_key(record["record_id"])
-        await self._redis.set(key, orjson.dumps(record))
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.set(key, orjson.dumps(record))
+        pipe.zadd(self._record_ids, {record["record_id"]: 0})
+        await pipe.execute()
         return record
 
+    async def create_records(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not records:
+            return records
+        pipe = self._redis.pipeline(transaction=False)
+        for record in records:
+            pipe.set(self._record_key(record["record_id"]), orjson.dumps(record))
+        pipe.zadd(self._record_ids, {record["record_id"]: 0 for record in records})
+        await pipe.execute()
+        return records
+
     async def update_record(self, record_id: str, updates: dict[str, Any]) -> dict[str, Any]:
-        record = await self.get_record(record_id)
-        record.update(updates)
-        await self._redis.set(self._record_key(record_id), orjson.dumps(record))
-        return record
+        return await self._modify_record(record_id, lambda record: record.update(updates))
 
-    async def get_record(self, record_id: str) -> dict[str, Any]:
+    async def get_record(self, record_id: str, *, fresh: bool = False) -> dict[str, Any]:
         raw = await self._redis.get(self._record_key(record_id))
         if raw is None:
             raise KeyError(record_id)
         return orjson.loads(raw)
 
     async def append_event(self, record_id: str, event: dict[str, Any]) -> dict[str, Any]:
-        record = await self.get_record(record_id)
-        record.setdefault("events", []).append(event)
-        await self._redis.set(self._record_key(record_id), orjson.dumps(record))
-        return record
+        return await self._modify_record(
+            record_id, lambda record: record.setdefault("events", []).append(event)
+        )
+
+    async def apply_event(
+        self, record_id: str, updates: dict[str, Any], event: dict[str, Any]
+    ) -> dict[str, Any]:
+        def mutate(record: dict[str, Any]) -> None:
+            record.update(updates)
+            record.setdefault("events", []).append(event)
+
+        return await self._modify_record(record_id, mutate)
+
+    async def _modify_record(
+        self, record_id: str, mutate: Callable[[dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """Read-modify-write under WATCH/MULTI/EXEC, retrying if another writer wins."""
+        key = self._record_key(record_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    raw = await pipe.get(key)
+                    if raw is None:
+                        raise KeyError(record_id)
+                    record = orjson.loads(raw)
+                    mutate(record)
+                    pipe.multi()
+                    pipe.set(key, orjson.dumps(record))
+                    await pipe.execute()
+                    return record
+                except WatchError:
+                    continue
 
     async def list_records(self) -> list[dict[str, Any]]:
+        # Record ids are tracked in an index so listing costs two round-trips
+        # instead of a SCAN over the whole keyspace.
+        await self._ensure_record_ids()
+        record_ids = await self._redis.zrange(self._record_ids, 0, -1)
+        if not record_ids:
+            return []
+        keys = [self._record_key(rid) for rid in record_ids]
+        values = await self._redis.mget(keys)
+        return [orjson.loads(value) for value in values if value]
+
+    async def list_records_page(
+        self, *, cursor: str | None = None, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        # The cursor is the last record id returned; the next page starts
+        # strictly after it, so each id is returned exactly once.
+        if cursor is None:
+            await self._ensure_record_ids()
+        start = b"(" + cursor.encode() if cursor is not None else b"-"
+        record_ids = await self._redis.zrangebylex(
+            self._record_ids, start, b"+", start=0, num=limit
+        )
+        records: list[dict[str, Any]] = []
+        if record_ids:
+            values = await self._redis.mget([self._record_key(rid) for rid in record_ids])
+            records = [orjson.loads(value) for value in values if value]
+        if len(record_ids) < limit:
+            return records, None
+        last = record_ids[-1]
+        return records, last.decode() if isinstance(last, bytes) else last
+
+    async def _ensure_record_ids(self) -> None:
+        if self._backfill_checked:
+            return
+        if not await self._redis.exists(self._record_ids_backfilled):
+            await self._backfill_record_ids()
+            await self._redis.set(self._record_ids_backfilled, b"1")
+        self._backfill_checked = True
+
+    async def _backfill_record_ids(self) -> None:
+        """Index records written before the id index existed."""
         pattern = self._record_key("*")
-        keys: list[str] = []
+        offset = len(self._record_prefix)
+        record_ids: list[bytes] = []
         cursor = 0
         while True:
             cursor, batch = await self._redis.scan(cursor=cursor, match=pattern, count=100)
-            keys.extend(batch)
+            record_ids.extend(
+                (key if isinstance(key, bytes) else key.encode())[offset:] for key in batch
+            )
             if cursor == 0:
                 break
-        if not keys:
-            return []
-        values = await self._redis.mget(keys)
-        return [orjson.loads(value) for value in values if value]
+        if record_ids:
+            await self._redis.zadd(self._record_ids, dict.fromkeys(record_ids, 0))
 
     # Recommendation storage methods
 
@@ -72,10 +187,12 @@ class RedisStorage:
 
     async def create_recommendation(self, recommendation: dict[str, Any]) -> dict[str, Any]:
         """Create a new recommendation record."""
-        key = self._recommendation_key(
-            recommendation["session_id"], recommendation["message_id"]
-        )
-        await self._redis.set(key, orjson.dumps(recommendation))
+        session_id = recommendation["session_id"]
+        message_id = recommendation["message_id"]
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.set(self._recommendation_key(session_id, message_id), orjson.dumps(recommendation))
+        pipe.sadd(self._session_recommendations_key(session_id), message_id)
+        await pipe.execute()
         return recommendation
 
     async def update_recommendation(
@@ -89,3 +206,19 @@ class RedisStorage:
         key = self._recommendation_key(session_id, message_id)
         await self._redis.set(key, orjson.dumps(recommendation))
         return recommendation
+
+    async def list_session_recommendations(self, session_id: str) -> list[dict[str, Any]]:
+        """List every recommendation stored for ``session_id``."""
+        # Message ids are indexed per session on create, so this is two
+        # round-trips rather than a keyspace SCAN.
+        message_ids = await self._redis.smembers(self._session_recommendations_key(session_id))
+        if not message_ids:
+            return []
+        keys = [
+            self._recommendation_key(
+                session_id, mid.decode() if isinstance(mid, bytes) else mid
+            )
+            for mid in message_ids
+        ]
+        values = await self._redis.mget(keys)
+        return [orjson.loads(value) for value in values if value]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from typing import Any, Union
 
 import orjson
@@ -22,8 +23,16 @@ def canonical_dumps(payload: Any) -> bytes:
     return orjson.dumps(payload, option=_ORJSON_OPTIONS)
 
 
+def canonical_fragment(payload: Any) -> orjson.Fragment:
+    """Pre-encode a payload so it can be embedded in several canonical documents."""
+    return orjson.Fragment(canonical_dumps(payload))
+
+
+def canonical_hash_bytes(payload: Any) -> bytes:
+    """Return the raw 32-byte SHA-256 digest of the canonical JSON representation."""
+    return hashlib.sha256(canonical_dumps(payload)).digest()
+
+
 def canonical_hash(payload: Any) -> str:
     """Return a SHA-256 hex digest for the canonical JSON representation."""
-    import hashlib
-
-    return hashlib.sha256(canonical_dumps(payload)).hexdigest()
+    return canonical_hash_bytes(payload).hex()
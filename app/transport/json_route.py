@@ -0,0 +1,28 @@
+"""FastAPI route class that parses JSON request bodies with orjson."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    async def json(self) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI
+        # still turns malformed bodies into 422 responses.
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import base64
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
@@ -24,6 +25,11 @@ def load_public_key(pem: str) -> Ed25519PublicKey:
     return serialization.load_pem_public_key(pem.encode("utf-8"))
 
 
+@lru_cache(maxsize=256)
+def _cached_public_key(pem: str) -> Ed25519PublicKey:
+    return load_public_key(pem)
+
+
 def load_private_key(pem: str) -> Ed25519PrivateKey:
     if not pem:
         raise SignatureError("private key missing")
@@ -31,20 +37,38 @@ def load_private_key(pem: str) -> Ed25519PrivateKey:
 
 
 def verify_signature(payload: Any, signature_b64: str, public_key_pem: str) -> None:
-    """Validate an ed25519 signature over the canonical JSON payload."""
+    """Validate an ed25519 signature over the canonical JSON payload.
+
+    ``payload`` may be the already-encoded canonical bytes, in which case it is
+    verified as-is instead of being serialized again.
+    """
     if not signature_b64:
         raise SignatureError("signature missing")
-    public_key = load_public_key(public_key_pem)
+    public_key = _cached_public_key(public_key_pem)
     try:
         signature = base64.b64decode(signature_b64)
     except (ValueError, TypeError) as exc:  # pragma: no cover - b64 check
         raise SignatureError("signature is not base64") from exc
     try:
-        public_key.verify(signature, canonical_dumps(payload))
+        message = payload if isinstance(payload, bytes) else canonical_dumps(payload)
+        public_key.verify(signature, message)
     except Exception as exc:  # pragma: no cover - delegated to cryptography
         raise SignatureError("signature verification failed") from exc
 
 
+def verify_batch(items: Iterable[tuple[Any, str, str]]) -> list[bool]:
+    """Verify ``(payload, signature_b64, public_key_pem)`` triples, one result per item."""
+    results: list[bool] = []
+    for payload, signature_b64, public_key_pem in items:
+        try:
+            verify_signature(payload, signature_b64, public_key_pem)
+        except ValueError:
+            results.append(False)
+        else:
+            results.append(True)
+    return results
+
+
 def sign_payload(payload: Any, private_key_pem: str) -> str:
     private_key = load_private_key(private_key_pem)
     signature = private_key.sign(canonical_dumps(payload))
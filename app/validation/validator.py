@@ -2,67 +2,113 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import tempfile
 from functools import lru_cache
+from importlib.metadata import version
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from jsonschema import Draft202012Validator, RefResolver, ValidationError
+import orjson
+from jsonschema import Draft202012Validator, ValidationError
 
 EXTENSION_VENDOR_PATTERN = r"^[a-z0-9][a-z0-9_-]{1,63}$"
 EXTENSION_DESCRIPTION = (
     "Vendor-namespaced extension container living under ext.<vendor_id>."
 )
+_FORMAT_CHECKER = Draft202012Validator.FORMAT_CHECKER
 
 
 class SchemaRegistry:
-    def __init__(self, schema_dir: Path) -> None:
+    def __init__(self, schema_dir: Path, cache_dir: Path | None = None) -> None:
         self._schema_dir = schema_dir
+        self._cache_dir = cache_dir
         self._validators: dict[str, Draft202012Validator] = {}
         self._load()
 
     def _load(self) -> None:
-        for schema_path in sorted(self._schema_dir.glob("*.json")):
-            data = json.loads(schema_path.read_text())
+        sources = {path.stem: path.read_bytes() for path in sorted(self._schema_dir.glob("*.json"))}
+        cache_path = self._cache_path(sources)
+        bundles = _read_cache(cache_path) if cache_path else None
+        if bundles is None:
+            bundles = self._build(sources)
+            if cache_path:
+                _write_cache(cache_path, bundles)
+        for stem, bundled in bundles.items():
+            self._validators[stem] = Draft202012Validator(
+                bundled,
+                format_checker=_FORMAT_CHECKER,
+            )
+
+    def _build(self, sources: dict[str, bytes]) -> dict[str, dict[str, Any]]:
+        raw: dict[str, dict[str, Any]] = {}
+        for stem, source in sources.items():
+            data = orjson.loads(source)
             self._inject_extension_namespace(data)
+            # Meta-schema checking dominates load time; check each file once
+            # rather than again inside every bundle that inlines it.
             Draft202012Validator.check_schema(data)
-            base_uri = schema_path.resolve().as_uri()
-            resolver = RefResolver(base_uri=base_uri, referrer=data)
-            self._validators[schema_path.stem] = Draft202012Validator(
-                data,
-                resolver=resolver,
-                format_checker=Draft202012Validator.FORMAT_CHECKER,
-            )
+            raw[stem] = data
+        return {stem: _bundle(stem, raw) for stem in raw}
+
+    def _cache_path(self, sources: dict[str, bytes]) -> Path | None:
+        """Cache entry for these exact schema sources, or None when caching is off."""
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(version("jsonschema").encode())
+        # The bundles are the output of this module's transforms (extension
+        # injection, ref rewriting), so any edit to it invalidates the cache.
+        digest.update(Path(__file__).read_bytes())
+        for stem, source in sources.items():
+            digest.update(b"\0" + stem.encode() + b"\0" + source)
+        return self._cache_dir / f"{digest.hexdigest()}.json"
 
     def _inject_extension_namespace(self, schema: Any) -> None:
         """Ensure schemas allow vendor IDs under ext.* without touching core fields."""
-        if not isinstance(schema, dict):
-            return
-        properties = schema.get("properties")
-        if isinstance(properties, dict):
-            for key in ("ext", "extensions"):
-                if key in properties:
-                    ext_block = properties[key]
-                    if isinstance(ext_block, dict) and "$ref" not in ext_block:
-                        ext_block.setdefault("description", EXTENSION_DESCRIPTION)
-                        ext_block.setdefault("type", "object")
-                        ext_block.setdefault(
-                            "patternProperties",
-                            {
-                                EXTENSION_VENDOR_PATTERN: {
-                                    "type": "object",
-                                    "description": "Operator-owned extension payload.",
-                                    "additionalProperties": True,
-                                }
-                            },
-                        )
-                        ext_block.setdefault("additionalProperties", False)
-        for value in schema.values():
-            if isinstance(value, dict):
-                self._inject_extension_namespace(value)
-            elif isinstance(value, list):
-                for item in value:
-                    self._inject_extension_namespace(item)
+        # Explicit stack instead of recursion: no frame per node, no depth limit.
+        # Nodes shared between several parents (or forming a cycle) are
+        # processed once.
+        stack = [schema]
+        seen: set[int] = set()
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            if isinstance(node, list):
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
+                continue
+            if not isinstance(node, dict):
+                continue
+            properties = node.get("properties")
+            if isinstance(properties, dict):
+                for key in ("ext", "extensions"):
+                    if key in properties:
+                        ext_block = properties[key]
+                        if isinstance(ext_block, dict) and "$ref" not in ext_block:
+                            ext_block.setdefault("description", EXTENSION_DESCRIPTION)
+                            ext_block.setdefault("type", "object")
+                            ext_block.setdefault(
+                                "patternProperties",
+                                {
+                                    EXTENSION_VENDOR_PATTERN: {
+                                        "type": "object",
+                                        "description": "Operator-owned extension payload.",
+                                        "additionalProperties": True,
+                                    }
+                                },
+                            )
+                            ext_block.setdefault("additionalProperties", False)
+            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+
+    def validator_for(self, schema_name: str) -> Callable[[Any], None]:
+        """Return the bound ``validate`` of a compiled schema for direct dispatch."""
+        try:
+            return self._validators[schema_name].validate
+        except KeyError as exc:
+            raise ValueError(f"unknown schema {schema_name}") from exc
 
     def validate(self, schema_name: str, payload: Any) -> None:
         try:
@@ -71,7 +117,100 @@ class SchemaRegistry:
             raise ValueError(f"unknown schema {schema_name}") from exc
 
 
+def _bundle(stem: str, raw: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Inline every schema ``stem`` references under ``$defs`` as one local document.
+
+    Cross-file refs such as ``./common.json#/definitions/x`` become
+    ``#/$defs/common/definitions/x``, so resolution is a pointer lookup in the
+    same document rather than a URI join against the schema's ``$id`` (which
+    would otherwise try to fetch the peer over the network).
+    """
+    queued = {stem}
+    pending = [stem]
+    bundled: dict[str, Any] = {}
+    while pending:
+        current = pending.pop()
+        bundled[current] = _rewrite_refs(raw[current], current, stem, raw, queued, pending)
+    root = bundled.pop(stem)
+    if bundled:
+        for peer in bundled.values():
+            peer.pop("$id", None)
+        root["$defs"] = {**root.get("$defs", {}), **bundled}
+    return root
+
+
+def _rewrite_refs(
+    node: Any,
+    owner: str,
+    root: str,
+    raw: dict[str, dict[str, Any]],
+    queued: set[str],
+    pending: list[str],
+) -> Any:
+    """Copy ``node`` with refs to known schemas pointed into the bundle root."""
+    if not isinstance(node, (dict, list)):
+        return node
+    # Explicit stack, like _inject_extension_namespace: no depth limit. Each
+    # entry pairs a source container with its (pre-sized) copy.
+    result: Any = {} if isinstance(node, dict) else [None] * len(node)
+    stack = [(node, result)]
+    while stack:
+        source, copy = stack.pop()
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        for key, value in items:
+            if isinstance(value, dict):
+                copy[key] = {}
+                stack.append((value, copy[key]))
+            elif isinstance(value, list):
+                copy[key] = [None] * len(value)
+                stack.append((value, copy[key]))
+            else:
+                copy[key] = value
+        if not isinstance(source, dict):
+            continue
+        ref = source.get("$ref")
+        if isinstance(ref, str):
+            target, _, pointer = ref.partition("#")
+            target_stem = Path(target).stem if target else owner
+            if target_stem in raw:
+                if target_stem != root:
+                    if target_stem not in queued:
+                        queued.add(target_stem)
+                        pending.append(target_stem)
+                    pointer = f"/$defs/{target_stem}{pointer}"
+                copy["$ref"] = f"#{pointer}"
+    return result
+
+
+def _read_cache(path: Path) -> dict[str, dict[str, Any]] | None:
+    try:
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_cache(path: Path, bundles: dict[str, dict[str, Any]]) -> None:
+    # Best effort: a read-only or shared cache directory must never break startup.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(orjson.dumps(bundles))
+        os.replace(tmp, path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+
+
+def _default_cache_dir() -> Path | None:
+    """Schema cache directory; caching is opt-in via AIP_SCHEMA_CACHE_DIR."""
+    configured = os.getenv("AIP_SCHEMA_CACHE_DIR")
+    return Path(configured) if configured else None
+
+
 @lru_cache(maxsize=1)
 def get_schema_registry() -> SchemaRegistry:
     schema_dir = Path(__file__).resolve().parent.parent / "schemas"
-    return SchemaRegistry(schema_dir)
+    return SchemaRegistry(schema_dir, cache_dir=_default_cache_dir())
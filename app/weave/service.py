@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 from ..auction.runner import AuctionRunner
 from ..storage import RecommendationStorage
@@ -14,12 +15,25 @@ from ..storage import RecommendationStorage
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WeaveService:
     """Service for managing Weave recommendations with background auction processing."""
 
     storage: RecommendationStorage
     auction_runner: AuctionRunner
+    max_concurrent_auctions: int = 64
+    completed_cache_size: int = 1024
+    # Completed is a terminal status, so its response can be served from
+    # memory without ever going stale; bounded as an LRU.
+    _completed: OrderedDict[tuple[str, str], dict[str, Any]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    # Strong references keep fire-and-forget tasks alive until they finish.
+    _tasks: set[asyncio.Task] = field(default_factory=set, init=False, repr=False)
+    _auction_slots: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._auction_slots = asyncio.Semaphore(self.max_concurrent_auctions)
 
     async def get_or_create_recommendation(
         self, session_id: str, message_id: str, query: str | None = None
@@ -33,55 +47,31 @@ class WeaveService:
         3. New: Just created, auction triggered in background
         """
         # Path 1 & 2: Check for existing recommendation
-        existing = await self.storage.get_recommendation(session_id, message_id)
-        if existing:
-            status = existing.get("status")
-            if status == "completed":
-                # Path 1: Return completed recommendation
-                logger.info(
-                    f"Cache hit: recommendation completed for {session_id}/{message_id}"
-                )
-                return {
-                    "status": "completed",
-                    "weave_content": existing.get("weave_content"),
-                    "serve_token": existing.get("serve_token"),
-                    "creative_metadata": existing.get("creative_metadata"),
-                }
-            elif status == "in_progress":
-                # Path 2: Auction still running
-                logger.info(
-                    f"Auction in progress for {session_id}/{message_id}"
-                )
-                return {
-                    "status": "in_progress",
-                    "retry_after_ms": 150,
-                    "message": "Auction in progress, please retry",
-                }
-            elif status == "failed":
-                # Return failure state
-                return {
-                    "status": "failed",
-                    "error": existing.get("error", "Auction failed"),
-                }
+        cached = await self.get_cached(session_id, message_id)
+        if cached is not None:
+            return cached
 
         # Path 3: No recommendation exists - create and trigger auction
-        logger.info(f"Cache miss: creating new recommendation for {session_id}/{message_id}")
+        logger.info("Cache miss: creating new recommendation for %s/%s", session_id, message_id)
         
         # Create initial record with in_progress status
+        now = datetime.now(timezone.utc).isoformat()
         recommendation = {
             "session_id": session_id,
             "message_id": message_id,
             "query": query,
             "status": "in_progress",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": now,
+            "updated_at": now,
         }
         await self.storage.create_recommendation(recommendation)
 
         # Trigger background auction (non-blocking)
-        asyncio.create_task(
+        task = asyncio.create_task(
             self._run_auction_and_update(session_id, message_id, query)
         )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
         # Return in_progress immediately
         return {
@@ -90,59 +80,99 @@ class WeaveService:
             "message": "Auction initiated, please retry",
         }
 
+    async def get_cached(self, session_id: str, message_id: str) -> dict[str, Any] | None:
+        """Return the response for an existing recommendation, or None if there is none."""
+        key = (session_id, message_id)
+        completed = self._completed.get(key)
+        if completed is not None:
+            self._completed.move_to_end(key)
+            return dict(completed)
+        existing = await self.storage.get_recommendation(session_id, message_id)
+        if not existing:
+            return None
+        respond = _STATUS_RESPONSES.get(existing.get("status"))
+        if respond is None:
+            return None
+        response = respond(existing, session_id, message_id)
+        if response["status"] == "completed":
+            self._remember_completed(key, response)
+        return response
+
+    def _remember_completed(self, key: tuple[str, str], response: dict[str, Any]) -> None:
+        self._completed[key] = dict(response)
+        self._completed.move_to_end(key)
+        if len(self._completed) > self.completed_cache_size:
+            self._completed.popitem(last=False)
+
     async def _run_auction_and_update(
         self, session_id: str, message_id: str, query: str | None
     ) -> None:
         """
         Background task: Run auction and update recommendation with results.
         
-        This runs asynchronously after the endpoint returns.
+        This runs asynchronously after the endpoint returns. At most
+        ``max_concurrent_auctions`` run at once; the rest wait for a slot.
         """
-        try:
-            logger.info(f"Starting background auction for {session_id}/{message_id}")
-            
-            # Build context_request from session/message context
-            context_request = self._build_context_request(
-                session_id, message_id, query
-            )
-
-            # Run the auction (this handles fanout, bid collection, winner selection)
-            auction_result = await self.auction_runner.run(context_request)
-
-            # Generate Weave creative from auction result
-            weave_payload = self._generate_weave_creative(auction_result)
-
-            # Update recommendation with completed status
-            updates = {
-                "status": "completed",
-                "weave_content": weave_payload.get("weave_content"),
-                "serve_token": weave_payload.get("serve_token"),
-                "creative_metadata": weave_payload.get("creative_metadata"),
-                "auction_result": auction_result,
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-            }
-            await self.storage.update_recommendation(session_id, message_id, updates)
-            
-            logger.info(
-                f"Auction completed successfully for {session_id}/{message_id}, "
-                f"serve_token={weave_payload.get('serve_token')}"
-            )
-
-        except Exception as exc:
-            logger.error(
-                f"Auction failed for {session_id}/{message_id}: {exc}",
-                exc_info=True,
-            )
-            # Update with failed status
-            updates = {
-                "status": "failed",
-                "error": str(exc),
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-            }
+        async with self._auction_slots:
             try:
+                logger.info("Starting background auction for %s/%s", session_id, message_id)
+
+                # Build context_request from session/message context
+                context_request = self._build_context_request(
+                    session_id, message_id, query
+                )
+
+                # Run the auction (this handles fanout, bid collection, winner selection)
+                auction_result = await self.auction_runner.run(context_request)
+
+                # Generate Weave creative from auction result
+                weave_payload = self._generate_weave_creative(auction_result)
+
+                # Update recommendation with completed status
+                updates = {
+                    "status": "completed",
+                    "weave_content": weave_payload.get("weave_content"),
+                    "serve_token": weave_payload.get("serve_token"),
+                    "creative_metadata": weave_payload.get("creative_metadata"),
+                    "auction_result": auction_result,
+                    "updated_at": datetime.now(timezone.utc).isoformat(),
+                }
                 await self.storage.update_recommendation(session_id, message_id, updates)
-            except Exception as update_exc:
-                logger.error(f"Failed to update recommendation status: {update_exc}")
+                self._remember_completed(
+                    (session_id, message_id),
+                    {
+                        "status": "completed",
+                        "weave_content": updates["weave_content"],
+                        "serve_token": updates["serve_token"],
+                        "creative_metadata": updates["creative_metadata"],
+                    },
+                )
+
+                logger.info(
+                    "Auction completed successfully for %s/%s, serve_token=%s",
+                    session_id,
+                    message_id,
+                    weave_payload.get("serve_token"),
+                )
+
+            except Exception as exc:
+                logger.error(
+                    "Auction failed for %s/%s: %s",
+                    session_id,
+                    message_id,
+                    exc,
+                    exc_info=True,
+                )
+                # Update with failed status
+                updates = {
+                    "status": "failed",
+                    "error": str(exc),
+                    "updated_at": datetime.now(timezone.utc).isoformat(),
+                }
+                try:
+                    await self.storage.update_recommendation(session_id, message_id, updates)
+                except Exception as update_exc:
+                    logger.error("Failed to update recommendation status: %s", update_exc)
 
     def _build_context_request(
         self, session_id: str, message_id: str, query: str | None
@@ -173,22 +203,19 @@ class WeaveService:
             }
 
         # Extract creative input from winner's offer
-        offer = winner.get("offer", {})
-        creative_input = offer.get("creative_input", {})
-        
-        brand_name = creative_input.get("brand_name", "")
-        product_name = creative_input.get("product_name", "")
-        descriptions = creative_input.get("descriptions", [])
-        resource_urls = creative_input.get("resource_urls", [])
-        
+        creative_input = (winner.get("offer") or {}).get("creative_input") or {}
+        get = creative_input.get
+        brand_name = get("brand_name", "")
+        product_name = get("product_name", "")
+        descriptions = get("descriptions")
+        resource_urls = get("resource_urls")
+
         # Format as Weave content with [Ad] label
         description = descriptions[0] if descriptions else ""
         url = resource_urls[0] if resource_urls else "#"
-        
-        weave_content = f"[Ad] {product_name} - {description} Learn more: {url}"
-        
+
         return {
-            "weave_content": weave_content,
+            "weave_content": f"[Ad] {product_name} - {description} Learn more: {url}",
             "serve_token": serve_token,
             "creative_metadata": {
                 "brand_name": brand_name,
@@ -198,3 +225,44 @@ class WeaveService:
             },
         }
 
+
+def _completed_response(
+    existing: dict[str, Any], session_id: str, message_id: str
+) -> dict[str, Any]:
+    # Path 1: Return completed recommendation
+    logger.info("Cache hit: recommendation completed for %s/%s", session_id, message_id)
+    return {
+        "status": "completed",
+        "weave_content": existing.get("weave_content"),
+        "serve_token": existing.get("serve_token"),
+        "creative_metadata": existing.get("creative_metadata"),
+    }
+
+
+def _in_progress_response(
+    existing: dict[str, Any], session_id: str, message_id: str
+) -> dict[str, Any]:
+    # Path 2: Auction still running
+    logger.info("Auction in progress for %s/%s", session_id, message_id)
+    return {
+        "status": "in_progress",
+        "retry_after_ms": 150,
+        "message": "Auction in progress, please retry",
+    }
+
+
+def _failed_response(
+    existing: dict[str, Any], session_id: str, message_id: str
+) -> dict[str, Any]:
+    return {
+        "status": "failed",
+        "error": existing.get("error", "Auction failed"),
+    }
+
+
+# Response builder per stored recommendation status; unknown statuses are a miss.
+_STATUS_RESPONSES: dict[str, Callable[[dict[str, Any], str, str], dict[str, Any]]] = {
+    "completed": _completed_response,
+    "in_progress": _in_progress_response,
+    "failed": _failed_response,
+}
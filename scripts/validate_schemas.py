@@ -1,17 +1,18 @@
 """Runs jsonschema validation for all protocol schemas."""
 
 from pathlib import Path
-import json
-from jsonschema import Draft202012Validator
+import sys
 
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
 
-SCHEMA_DIR = Path(__file__).resolve().parent.parent / "app" / "schemas"
+from app.validation.validator import SchemaRegistry  # noqa: E402
 
 
 def validate() -> None:
-    for schema in SCHEMA_DIR.glob("*.json"):
-        data = json.loads(schema.read_text())
-        Draft202012Validator.check_schema(data)
+    # Loading the registry meta-schema checks every file (after extension
+    # injection and $ref bundling); skip the cache so the check always runs.
+    SchemaRegistry(ROOT / "app" / "schemas", cache_dir=None)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+"""Unit tests for the per-auction bid response inbox."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from app.auction.models import BidResponse
+from app.events.handler import BidResponseInbox
+from app.transport.canonical_json import canonical_dumps
+from app.transport.signatures import sign_payload
+
+
+def _bid(bidder: str, price: float = 1.0) -> BidResponse:
+    return BidResponse(bidder=bidder, payload={"bidder": bidder}, price=price)
+
+
+def _keypair() -> tuple[str, str]:
+    key = Ed25519PrivateKey.generate()
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+    return private_pem, public_pem
+
+
+def _signed_bid(bidder: str, signing_key: str, public_key: str) -> BidResponse:
+    bid = {"brand_agent_id": bidder}
+    signature = sign_payload(bid, signing_key)
+    return BidResponse(
+        bidder=bidder,
+        payload={"bid": bid},
+        price=1.0,
+        signed=(canonical_dumps(bid), signature, public_key),
+    )
+
+
+class TestBidResponseInbox:
+    """Test registration, admission, and window collection."""
+
+    @pytest.mark.asyncio
+    async def test_collects_bids_submitted_during_window(self):
+        inbox = BidResponseInbox()
+        await inbox.register("stk_1", ["alpha", "beta"])
+
+        async def submit_late():
+            await asyncio.sleep(0.01)
+            await inbox.add("stk_1", _bid("beta"))
+
+        await inbox.add("stk_1", _bid("alpha"))
+        task = asyncio.create_task(submit_late())
+        responses = await inbox.collect("stk_1", window_ms=100)
+        await task
+
+        assert sorted(response.bidder for response in responses) == ["alpha", "beta"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_unsubscribed_bidder(self):
+        inbox = BidResponseInbox()
+        await inbox.register("stk_1", ["alpha"])
+
+        with pytest.raises(PermissionError):
+            await inbox.add("stk_1", _bid("mallory"))
+
+    @pytest.mark.asyncio
+    async def test_rejects_after_collection(self):
+        inbox = BidResponseInbox()
+        await inbox.register("stk_1", ["alpha"])
+        await inbox.collect("stk_1", window_ms=1)
+
+        with pytest.raises(PermissionError):
+            await inbox.add("stk_1", _bid("alpha"))
+
+    @pytest.mark.asyncio
+    async def test_returns_early_when_all_bidders_respond(self):
+        inbox = BidResponseInbox()
+        await inbox.register("stk_1", ["alpha", "beta"])
+        await inbox.add("stk_1", _bid("alpha"))
+        await inbox.add("stk_1", _bid("beta"))
+
+        responses = await asyncio.wait_for(inbox.collect("stk_1", window_ms=5000), timeout=1)
+
+        assert len(responses) == 2
+
+    @pytest.mark.asyncio
+    async def test_drops_bids_with_invalid_signatures(self):
+        private_pem, public_pem = _keypair()
+        forger_pem, _ = _keypair()
+        inbox = BidResponseInbox()
+        await inbox.register("stk_1", ["alpha", "beta"])
+        await inbox.add("stk_1", _signed_bid("alpha", private_pem, public_pem))
+        await inbox.add("stk_1", _signed_bid("beta", forger_pem, public_pem))
+
+        responses = await inbox.collect("stk_1", window_ms=20)
+
+        assert [response.bidder for response in responses] == ["alpha"]
+
+    @pytest.mark.asyncio
+    async def test_forged_bid_does_not_close_window(self):
+        private_pem, public_pem = _keypair()
+        forger_pem, _ = _keypair()
+        inbox = BidResponseInbox()
+        await inbox.register("stk_1", ["alpha"])
+        await inbox.add("stk_1", _signed_bid("alpha", forger_pem, public_pem))
+
+        async def submit_genuine():
+            await asyncio.sleep(0.02)
+            await inbox.add("stk_1", _signed_bid("alpha", private_pem, public_pem))
+
+        task = asyncio.create_task(submit_genuine())
+        responses = await inbox.collect("stk_1", window_ms=500)
+        await task
+
+        assert len(responses) == 1
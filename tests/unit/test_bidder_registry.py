@@ -0,0 +1,66 @@
+"""Unit tests for the YAML-backed bidder registry."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.bidders.registry import BidderRegistry
+
+BIDDERS_YAML = """
+bidders:
+  - name: beta
+    endpoint: https://beta.invalid/bid
+    pools: [retail, travel]
+  - name: alpha
+    endpoint: https://alpha.invalid/bid
+    pools: [retail]
+  - name: gamma
+    endpoint: https://gamma.invalid/bid
+"""
+
+
+@pytest.fixture
+def bidders_path(tmp_path: Path) -> Path:
+    path = tmp_path / "bidders.yaml"
+    path.write_text(BIDDERS_YAML)
+    return path
+
+
+@pytest.fixture
+def registry(bidders_path: Path) -> BidderRegistry:
+    return BidderRegistry(bidders_path)
+
+
+class TestPoolsIndex:
+    """Test the pool -> bidders inverted index."""
+
+    def test_index_is_sorted_by_pool_and_bidder(self, registry):
+        assert registry.pools_index == {
+            "default": ("gamma",),
+            "retail": ("alpha", "beta"),
+            "travel": ("beta",),
+        }
+
+    def test_filter_by_pools_deduplicates(self, registry):
+        names = [bidder.name for bidder in registry.filter_by_pools(["retail", "travel"])]
+        assert names == ["beta", "alpha"]
+
+    def test_filter_by_pools_keeps_registration_order(self, registry):
+        names = [bidder.name for bidder in registry.filter_by_pools(["default", "retail"])]
+        assert names == ["beta", "alpha", "gamma"]
+
+    def test_filter_by_unknown_pool_is_empty(self, registry):
+        assert registry.filter_by_pools(["unknown"]) == []
+
+    def test_reload_bumps_version(self, registry):
+        version = registry.version
+        registry.reload()
+        assert registry.version == version + 1
+
+    def test_reload_picks_up_file_changes(self, registry, bidders_path):
+        bidders_path.write_text(BIDDERS_YAML + "  - name: delta\n    endpoint: https://delta.invalid/bid\n")
+        registry.reload()
+        assert registry.get("delta") is not None
+        assert registry.pools_index["default"] == ("delta", "gamma")
@@ -0,0 +1,123 @@
+"""Unit tests for the read-through storage cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.events.anti_replay import EventReplayGuard
+from app.events.handler import EventService
+from app.ledger.apply import LedgerService
+from app.storage.cached import CachedStorage
+from app.storage.in_memory import InMemoryStorage
+
+
+class CountingStorage(InMemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    async def get_record(self, record_id, *, fresh=False):
+        self.reads += 1
+        return await super().get_record(record_id)
+
+
+class TestCachedStorage:
+    """Test cache hits, write-through and copy isolation."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_hit_cache(self):
+        backend = CountingStorage()
+        await backend.create_record({"record_id": "r1", "state": "pending"})
+        storage = CachedStorage(backend, ttl=60)
+
+        await storage.get_record("r1")
+        await storage.get_record("r1")
+
+        assert backend.reads == 1
+
+    @pytest.mark.asyncio
+    async def test_updates_write_through(self):
+        backend = CountingStorage()
+        storage = CachedStorage(backend, ttl=60)
+        await storage.create_record({"record_id": "r1", "state": "pending"})
+
+        await storage.update_record("r1", {"state": "served"})
+        record = await storage.get_record("r1")
+
+        assert record["state"] == "served"
+        assert backend.reads == 0
+
+    @pytest.mark.asyncio
+    async def test_returned_records_are_copies(self):
+        storage = CachedStorage(InMemoryStorage(), ttl=60)
+        await storage.create_record({"record_id": "r1", "events": []})
+
+        (await storage.get_record("r1"))["events"].append({"type": "x"})
+
+        assert (await storage.get_record("r1"))["events"] == []
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self):
+        backend = CountingStorage()
+        await backend.create_record({"record_id": "r1"})
+        storage = CachedStorage(backend, ttl=0)
+
+        await storage.get_record("r1")
+        await storage.get_record("r1")
+
+        assert backend.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_fresh_reads_bypass_cache(self):
+        backend = CountingStorage()
+        storage = CachedStorage(backend, ttl=60)
+        await storage.create_record({"record_id": "r1", "state": "created"})
+
+        await storage.get_record("r1", fresh=True)
+
+        assert backend.reads == 1
+
+
+class TestCachedLedgerBilling:
+    """Billing paths must not decide from a record another server has changed."""
+
+    @pytest.mark.asyncio
+    async def test_settle_reads_current_state(self):
+        backend = InMemoryStorage()
+        storage = CachedStorage(backend, ttl=60)
+        await storage.create_record({"record_id": "r1", "state": "created"})
+        # Another server settles the auction behind this process's cache.
+        await backend.update_record("r1", {"state": "auction_completed"})
+
+        with pytest.raises(ValueError, match="invalid transition"):
+            await LedgerService(storage).settle_auction("r1", [], None)
+
+    @pytest.mark.asyncio
+    async def test_ingest_sees_charges_from_other_servers(self):
+        backend = InMemoryStorage()
+        storage = CachedStorage(backend, ttl=60)
+        await storage.create_record(
+            {"record_id": "stk_1", "state": "auction_completed", "max_event_priority": -1}
+        )
+        # Another server has already billed a click for this serve token.
+        await backend.update_record("stk_1", {"max_event_priority": 1})
+        service = EventService(LedgerService(storage), EventReplayGuard(), max_skew_ms=500)
+        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+        with pytest.raises(ValueError, match="single-charge"):
+            await service.ingest(
+                {
+                    "event_type": "cpc_click",
+                    "event_id": "evt_1",
+                    "serve_token": "stk_1",
+                    "session_id": "sess_1",
+                    "platform_id": "pf_1",
+                    "brand_agent_id": "ba_1",
+                    "wallet_id": "w_1",
+                    "pricing": {"unit": "CPC", "amount_cents": 45},
+                    "timestamp": now,
+                    "ts": now,
+                }
+            )
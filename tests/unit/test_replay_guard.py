@@ -0,0 +1,52 @@
+"""Unit tests for the event replay guard."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.events.anti_replay import EventReplayGuard, replay_fingerprint
+
+
+class TestEventReplayGuard:
+    """Test duplicate detection and bounded retention."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_duplicate_event(self):
+        guard = EventReplayGuard(ttl_seconds=60)
+        await guard.assert_unique("stk_1:cpc_click:evt_1")
+
+        with pytest.raises(ValueError, match="already ingested"):
+            await guard.assert_unique("stk_1:cpc_click:evt_1")
+
+    @pytest.mark.asyncio
+    async def test_rejects_missing_event_id(self):
+        guard = EventReplayGuard()
+
+        with pytest.raises(ValueError, match="missing"):
+            await guard.assert_unique("")
+
+    @pytest.mark.asyncio
+    async def test_forgets_entries_after_ttl(self):
+        guard = EventReplayGuard(ttl_seconds=0)
+        await guard.assert_unique("evt_1")
+        await guard.assert_unique("evt_1")
+
+    @pytest.mark.asyncio
+    async def test_full_guard_rejects_new_keys(self):
+        guard = EventReplayGuard(ttl_seconds=60, capacity=2)
+        await guard.assert_unique("evt_1")
+        await guard.assert_unique("evt_2")
+
+        with pytest.raises(ValueError, match="full"):
+            await guard.assert_unique("evt_3")
+        with pytest.raises(ValueError, match="already ingested"):
+            await guard.assert_unique("evt_1")
+
+    @pytest.mark.asyncio
+    async def test_accepts_fingerprint_keys(self):
+        guard = EventReplayGuard(ttl_seconds=60)
+        await guard.assert_unique(replay_fingerprint("stk_1", "cpc_click", "evt_1"))
+        await guard.assert_unique(replay_fingerprint("stk_1", "cpc_click", "evt_2"))
+
+        with pytest.raises(ValueError, match="already ingested"):
+            await guard.assert_unique(replay_fingerprint("stk_1", "cpc_click", "evt_1"))
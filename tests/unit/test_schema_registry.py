@@ -0,0 +1,35 @@
+"""Unit tests for schema loading and cross-file $ref bundling."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from jsonschema import ValidationError
+
+from app.validation.validator import get_schema_registry
+
+SCHEMA_DIR = Path(__file__).resolve().parents[2] / "app" / "schemas"
+
+
+def _context_request_example() -> dict:
+    schema = json.loads((SCHEMA_DIR / "context_request.json").read_text())
+    return dict(schema["examples"][0])
+
+
+class TestSchemaRegistry:
+    """Test that refs into common.json resolve locally."""
+
+    def test_common_ref_resolves_without_network(self):
+        payload = _context_request_example()
+        payload["metadata"] = {"platform": {"surface": "chat"}}
+
+        get_schema_registry().validate("context_request", payload)
+
+    def test_common_ref_is_enforced(self):
+        payload = _context_request_example()
+        payload["metadata"] = {"Not A Vendor": {}}
+
+        with pytest.raises(ValidationError):
+            get_schema_registry().validate("context_request", payload)
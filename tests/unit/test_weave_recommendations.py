@@ -263,6 +263,39 @@ class TestWeaveServiceFailedPath:
         assert "Auction timeout" in result["error"]
 
 
+class TestWeaveServiceGetCached:
+    """Test the read-only polling lookup."""
+
+    @pytest.mark.asyncio
+    async def test_get_cached_never_creates_record(self, weave_service, mock_storage):
+        """Test that a missing recommendation returns None without starting an auction."""
+        mock_storage.get_recommendation.return_value = None
+
+        result = await weave_service.get_cached("sess_123", "msg_456")
+
+        assert result is None
+        mock_storage.create_recommendation.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_completed_response_served_from_memory(self, weave_service, mock_storage):
+        """Test that a completed recommendation is only read from storage once."""
+        mock_storage.get_recommendation.return_value = {
+            "session_id": "sess_123",
+            "message_id": "msg_456",
+            "status": "completed",
+            "weave_content": "[Ad] Test",
+            "serve_token": "stk_abc123",
+            "creative_metadata": {},
+        }
+
+        first = await weave_service.get_cached("sess_123", "msg_456")
+        second = await weave_service.get_cached("sess_123", "msg_456")
+
+        assert first == second
+        assert second["serve_token"] == "stk_abc123"
+        mock_storage.get_recommendation.assert_called_once()
+
+
 class TestWeaveCreativeGeneration:
     """Test Weave creative generation logic."""
 